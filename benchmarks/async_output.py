@@ -0,0 +1,100 @@
+import sys
+import json
+import multiprocessing
+from time import perf_counter
+
+"""
+BENCHMARK : ASYNCHRONOUS OUTPUT
+
+Wall time per step of the ElasticViscousPlasticTransport box test dumping
+every step (u, s, h and a), with the output written in step (firedrake File)
+and with dump_async (AsyncOutputWriter), for each mesh size. The difference
+is the output time the background writer overlaps with the solves; the
+interpolation and copy of the fields stay on the main thread in both cases.
+Each case runs in a fresh process, after a first run that compiles the
+forms.
+
+usage : python async_output.py [--sizes 20,40,80] [--steps 10]
+    [--json results.json]
+"""
+
+sizes = [20, 40, 80]
+steps = 10
+
+
+def case(dump_async, values, steps):
+    from seaice import ElasticViscousPlasticTransport
+    from seaice.warmup import build_model, length
+    from firedrake import SquareMesh
+
+    mesh = SquareMesh(values, values, length)
+    dirname = "./output/bench/async_{}_{}/u.pvd".format(dump_async, values)
+    ice = build_model(
+        ElasticViscousPlasticTransport,
+        mesh,
+        dirname,
+        family="CG",
+        timestepping={"timescale": steps + 1},
+        output={"dumpfreq": 1, "dump_async": dump_async},
+    )
+
+    # the first step compiles the forms and the output interpolations
+    ice.timescale = 1
+    ice.run()
+
+    ice.timescale = steps + 1
+    begin = perf_counter()
+    ice.run(1)
+    seconds = perf_counter() - begin
+
+    return {
+        "dump_async": dump_async,
+        "number_of_triangles": values,
+        "seconds_per_step": seconds / steps,
+        "solve_seconds_per_step": ice.timings["solve"] / steps,
+        "output_seconds_per_step": ice.timings["output"] / steps,
+    }
+
+
+def main(argv):
+    global sizes, steps
+    filename = None
+    if "--sizes" in argv:
+        sizes = [int(i) for i in argv[argv.index("--sizes") + 1].split(",")]
+    if "--steps" in argv:
+        steps = int(argv[argv.index("--steps") + 1])
+    if "--json" in argv:
+        filename = argv[argv.index("--json") + 1]
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for values in sizes:
+        cases = {}
+        for dump_async in [False, True]:
+            with context.Pool(1) as pool:
+                cases[dump_async] = pool.apply(case, (dump_async, values, steps))
+            results.append(cases[dump_async])
+        in_step, overlapped = cases[False], cases[True]
+        # the share of the in step output time that the writer thread hides
+        hidden = (
+            in_step["seconds_per_step"] - overlapped["seconds_per_step"]
+        ) / in_step["output_seconds_per_step"]
+        print(
+            "n={:<5} in step {:8.3f} s/step (output {:7.3f}) "
+            "async {:8.3f} s/step (output {:7.3f}) hidden {:5.0%}".format(
+                values,
+                in_step["seconds_per_step"],
+                in_step["output_seconds_per_step"],
+                overlapped["seconds_per_step"],
+                overlapped["output_seconds_per_step"],
+                hidden,
+            )
+        )
+
+    if filename is not None:
+        with open(filename, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
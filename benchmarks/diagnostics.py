@@ -0,0 +1,45 @@
+from seaice import *
+from firedrake import *
+from time import perf_counter
+
+"""
+BENCHMARK : DIAGNOSTICS
+
+Per-call cost of the energy and error diagnostics on the 35x35 EVP mesh,
+comparing the static compute() (form rebuilt on every call) with the
+stateful evaluate() (form built once).
+"""
+
+calls = 200
+number_of_triangles = 35
+length = 5 * 10 ** 5
+mesh = SquareMesh(number_of_triangles, number_of_triangles, length)
+x, y = SpatialCoordinate(mesh)
+
+pi_x = pi / length
+v_exp = as_vector([-sin(pi_x * x) * sin(pi_x * y), -sin(pi_x * x) * sin(pi_x * y)])
+
+V = VectorFunctionSpace(mesh, "CG", 1)
+v = Function(V).interpolate(v_exp)
+
+
+def per_call(func):
+    func()
+    begin = perf_counter()
+    for _ in range(calls):
+        func()
+    return (perf_counter() - begin) / calls
+
+
+energy = Energy(v)
+error = Error(v, v_exp)
+
+results = [
+    ("Energy.compute", per_call(lambda: Energy.compute(v))),
+    ("Energy.evaluate", per_call(energy.evaluate)),
+    ("Error.compute", per_call(lambda: Error.compute(v, v_exp))),
+    ("Error.evaluate", per_call(error.evaluate)),
+]
+
+for name, seconds in results:
+    print("{:<16} {:10.1f} us/call".format(name, seconds * 10 ** 6))
@@ -0,0 +1,72 @@
+import sys
+import json
+import subprocess
+from statistics import median
+
+"""
+BENCHMARK : IMPORT TIME
+
+Wall time of importing seaice (and, for reference, firedrake alone) in a
+fresh interpreter, and which of the optional heavy modules the import
+pulls in. netCDF4 and matplotlib should only be loaded once OutputDiagnostics
+or Plotter are used.
+
+usage : python import_time.py [--repeats 5] [--json results.json]
+"""
+
+optional = ["netCDF4", "matplotlib"]
+
+script = """
+import sys
+from time import perf_counter
+begin = perf_counter()
+import {module}
+seconds = perf_counter() - begin
+loaded = [name for name in {optional!r} if name in sys.modules]
+print(seconds, ",".join(loaded))
+"""
+
+
+def time_import(module):
+    output = subprocess.run(
+        [sys.executable, "-c", script.format(module=module, optional=optional)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split("\n")[-2]
+    seconds, _, loaded = output.partition(" ")
+    return float(seconds), [name for name in loaded.split(",") if name]
+
+
+def main(argv):
+    repeats = 5
+    filename = None
+    if "--repeats" in argv:
+        repeats = int(argv[argv.index("--repeats") + 1])
+    if "--json" in argv:
+        filename = argv[argv.index("--json") + 1]
+
+    results = []
+    for module in ["firedrake", "seaice"]:
+        # the first import also fills the bytecode caches
+        time_import(module)
+        timings = [time_import(module) for _ in range(repeats)]
+        result = {
+            "module": module,
+            "median_seconds": median(seconds for seconds, loaded in timings),
+            "min_seconds": min(seconds for seconds, loaded in timings),
+            "optional_modules_loaded": timings[-1][1],
+        }
+        results.append(result)
+        print(
+            "{module:<10} {median_seconds:8.3f} s (min {min_seconds:.3f} s) "
+            "loads {optional_modules_loaded}".format(**result)
+        )
+
+    if filename is not None:
+        with open(filename, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,137 @@
+import sys
+import json
+import multiprocessing
+from time import perf_counter
+
+"""
+BENCHMARK : MODELS
+
+For every model class, family and mesh size: the time to construct the
+model, the time of the first step (which includes form compilation unless
+the kernels are already in the disk cache, see python -m seaice.warmup) and
+the mean time of the steady steps that follow. Each case runs in a fresh
+process so that no kernels are shared through the in-memory caches.
+
+usage : python model_timings.py [model ...] [--sizes 10,20,40]
+    [--families CR,CG] [--steps 5] [--json results.json]
+    [--compare baseline.json]
+
+--compare reports every case whose steady time per step is more than
+tolerance slower than in an earlier --json file, and exits with status 1
+if there are any.
+"""
+
+models = ["vp", "vpt", "evp", "evps", "evpt", "mevp"]
+sizes = [10, 20, 40]
+families = ["CR", "CG"]
+steps = 5
+tolerance = 0.25
+
+
+def case(name, family, values, steps):
+    from seaice.warmup import model_variants, build_model, length
+    from firedrake import SquareMesh
+
+    mesh = SquareMesh(values, values, length)
+
+    begin = perf_counter()
+    ice = build_model(
+        model_variants[name][0],
+        mesh,
+        # a directory per case, so that cases do not replace each other's output
+        "./output/bench/timings_{}_{}_{}/u.pvd".format(name, family, values),
+        family=family,
+        timestepping={"timescale": steps + 1},
+    )
+    construction = perf_counter() - begin
+
+    def step():
+        ice.solve(*ice.solvers)
+        for old_var, new_var in ice.time_levels:
+            ice.update(old_var, new_var)
+
+    begin = perf_counter()
+    step()
+    first_step = perf_counter() - begin
+
+    begin = perf_counter()
+    for _ in range(steps):
+        step()
+    seconds_per_step = (perf_counter() - begin) / steps
+
+    return {
+        "model": name,
+        "family": family,
+        "number_of_triangles": values,
+        "dofs": sum(func.function_space().dim() for func, _ in ice.time_levels),
+        "construction_seconds": construction,
+        "first_step_seconds": first_step,
+        "seconds_per_step": seconds_per_step,
+    }
+
+
+def key(result):
+    return result["model"], result["family"], result["number_of_triangles"]
+
+
+def compare(results, baseline):
+    """
+    Returns the cases that are more than tolerance slower than the baseline.
+    """
+    before = {key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        if key(result) not in before:
+            continue
+        ratio = result["seconds_per_step"] / before[key(result)]["seconds_per_step"]
+        if ratio > 1 + tolerance:
+            regressions.append((key(result), ratio))
+    return regressions
+
+
+def main(argv):
+    global sizes, families, steps
+    filename = None
+    if "--sizes" in argv:
+        sizes = [int(i) for i in argv[argv.index("--sizes") + 1].split(",")]
+    if "--families" in argv:
+        families = argv[argv.index("--families") + 1].split(",")
+    if "--steps" in argv:
+        steps = int(argv[argv.index("--steps") + 1])
+    if "--json" in argv:
+        filename = argv[argv.index("--json") + 1]
+    baseline = None
+    if "--compare" in argv:
+        with open(argv[argv.index("--compare") + 1]) as f:
+            baseline = json.load(f)
+    names = [a for a in argv if a in models] or models
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for name in names:
+        for family in families:
+            for values in sizes:
+                with context.Pool(1) as pool:
+                    result = pool.apply(case, (name, family, values, steps))
+                results.append(result)
+                print(
+                    "{model:<5} {family} n={number_of_triangles:<5} "
+                    "dofs={dofs:<9} construct {construction_seconds:7.3f} s "
+                    "first step {first_step_seconds:7.3f} s "
+                    "{seconds_per_step:8.3f} s/step".format(**result)
+                )
+
+    if filename is not None:
+        with open(filename, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline)
+        for (name, family, values), ratio in regressions:
+            print("slower: {} {} n={} x{:.2f}".format(name, family, values, ratio))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
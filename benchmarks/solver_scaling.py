@@ -0,0 +1,102 @@
+import sys
+import json
+import resource
+import multiprocessing
+from time import perf_counter
+
+"""
+BENCHMARK : SOLVER SCALING
+
+Time per step and peak memory of the ElasticViscousPlastic box test for each
+solver preset as the mesh is refined. Every (preset, resolution) pair runs in
+a fresh process so that the peak resident set size is attributable to it.
+
+usage : python solver_scaling.py [preset ...] [--json results.json]
+"""
+
+number_of_triangles = [20, 40, 80, 160]
+steps = 3
+
+
+def box_test(preset, values):
+    from seaice import (
+        ElasticViscousPlastic,
+        Conditions,
+        TimesteppingParameters,
+        OutputParameters,
+        SolverParameters,
+        SeaIceParameters,
+    )
+    from firedrake import SquareMesh, SpatialCoordinate, as_vector, as_matrix
+
+    length = 5 * 10 ** 5
+    mesh = SquareMesh(values, values, length)
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_matrix([[0, 0], [0, 0]])}
+    conditions = Conditions(family="CG", ocean_curr=ocean_curr, ic=ic)
+    timestepping = TimesteppingParameters(timescale=steps, timestep=1)
+    # a directory per case, so that the output of one case does not replace
+    # that of the others
+    dirname = "./output/bench/scaling_{}_{}/u.pvd".format(preset, values)
+    output = OutputParameters(dirname=dirname, dumpfreq=10 ** 6)
+    solver = SolverParameters()
+
+    evp = ElasticViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=SeaIceParameters(),
+        solver_params=solver,
+    )
+    evp.assemble(evp.eqn, evp.w1, evp.bcs, preset)
+
+    # the first step includes form compilation
+    evp.solve(evp.usolver)
+    evp.update(evp.w0, evp.w1)
+
+    begin = perf_counter()
+    for _ in range(steps):
+        evp.solve(evp.usolver)
+        evp.update(evp.w0, evp.w1)
+    seconds = (perf_counter() - begin) / steps
+
+    return {
+        "preset": preset,
+        "number_of_triangles": values,
+        "dofs": evp.W1.dim(),
+        "seconds_per_step": seconds,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main(argv):
+    filename = None
+    if "--json" in argv:
+        filename = argv[argv.index("--json") + 1]
+        argv = [a for a in argv if a not in ("--json", filename)]
+    presets = argv or ["test", "gmres_ilu", "fgmres_asm", "bjacobi"]
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for preset in presets:
+        for values in number_of_triangles:
+            with context.Pool(1) as pool:
+                result = pool.apply(box_test, (preset, values))
+            results.append(result)
+            print(
+                "{preset:<12} n={number_of_triangles:<5} dofs={dofs:<9} "
+                "{seconds_per_step:8.3f} s/step {peak_rss_mb:9.1f} MB".format(**result)
+            )
+
+    if filename is not None:
+        with open(filename, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,107 @@
+import sys
+import json
+from time import perf_counter
+from seaice import *
+from firedrake import *
+
+"""
+BENCHMARK : VP MULTIGRID
+
+Krylov iterations per Newton step of the ViscousPlastic momentum solve as the
+mesh is refined, for geometric multigrid (vp_mg) and algebraic multigrid
+(gmres_amg). The coarse mesh has base triangles per side and every level
+halves the mesh size. For weak scaling, run the level with 4^k times as
+many ranks as the coarsest level, e.g.
+
+    mpiexec -n 1 python vp_multigrid.py --levels 0
+    mpiexec -n 4 python vp_multigrid.py --levels 1
+    mpiexec -n 16 python vp_multigrid.py --levels 2
+
+usage : python vp_multigrid.py [--levels 0,1,2,3] [--json results.json]
+"""
+
+base = 16
+steps = 3
+length = 5 * 10 ** 5
+
+
+def run(preset, refinements):
+    hierarchy = MeshHierarchy(SquareMesh(base, base, length), refinements)
+    mesh = hierarchy[-1]
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+    geo_wind = as_vector(
+        [
+            5 - 3 * sin(2 * pi * x / length) * sin(2 * pi * y / length),
+            5 - 3 * sin(2 * pi * y / length) * sin(2 * pi * x / length),
+        ]
+    )
+    ic = {"u": 0, "a": x / length, "h": 1}
+    conditions = Conditions(
+        family="CG", ocean_curr=ocean_curr, geo_wind=geo_wind, ic=ic
+    )
+    timestepping = TimesteppingParameters(timescale=steps * 600, timestep=600)
+    output = OutputParameters(dirname="./output/bench/u.pvd", dumpfreq=10 ** 6)
+    solver = SolverParameters(preset=preset)
+
+    vp = ViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=SeaIceParameters(),
+        solver_params=solver,
+    )
+    vp.assemble(vp.eqn, vp.u1, vp.bcs, preset)
+
+    newton = 0
+    krylov = 0
+    begin = perf_counter()
+    for _ in range(steps):
+        vp.solve(vp.usolver)
+        newton += vp.usolver.snes.getIterationNumber()
+        krylov += vp.usolver.snes.getLinearSolveIterations()
+        vp.update(vp.u0, vp.u1)
+    seconds = (perf_counter() - begin) / steps
+
+    return {
+        "preset": preset,
+        "number_of_triangles": base * 2 ** refinements,
+        "dofs": vp.V.dim(),
+        "ranks": mesh.comm.size,
+        "newton_its_per_step": newton / steps,
+        "krylov_its_per_newton": krylov / max(newton, 1),
+        "seconds_per_step": seconds,
+    }
+
+
+def main(argv):
+    levels = [0, 1, 2, 3]
+    filename = None
+    if "--levels" in argv:
+        levels = [int(i) for i in argv[argv.index("--levels") + 1].split(",")]
+    if "--json" in argv:
+        filename = argv[argv.index("--json") + 1]
+
+    results = []
+    for preset in ["vp_mg", "gmres_amg"]:
+        for refinements in levels:
+            result = run(preset, refinements)
+            results.append(result)
+            PETSc.Sys.Print(
+                "{preset:<10} n={number_of_triangles:<5} dofs={dofs:<9} "
+                "ranks={ranks:<4} newton/step={newton_its_per_step:5.1f} "
+                "krylov/newton={krylov_its_per_newton:6.1f} "
+                "{seconds_per_step:8.3f} s/step".format(**result)
+            )
+
+    if filename is not None and COMM_WORLD.rank == 0:
+        with open(filename, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -78,17 +78,15 @@ diag = OutputDiagnostics(description="test 3", dirname=diagnostic_dirname)
 
 d = Function(bt.D)
 
-t = 0
-while t < timescale - 0.5 * timestep:
-    bt.solve(bt.usolver)
-    bt.update(bt.w0, bt.w1)
-    diag.dump(bt.w1, t=t)
-    d.interpolate(bt.delta(bt.u1))
-    bt.dump(bt.u1, bt.a1, bt.h1, d, t=t)
-    t += timestep
+
+def forcing(model, t):
     t0.assign(t)
-    bt.progress(t)
+    d.interpolate(model.delta(model.u1))
+
+
+bt.run(callbacks=[forcing], diagnostics=diag, fields=(bt.u1, bt.a1, bt.h1, d))
 
+diag.close()
 
 plotter = Plotter(
     dataset_dirname=diagnostic_dirname,
@@ -130,6 +130,11 @@ while t < timescale - 0.5 * timestep:
     t += timestep
     vp.progress(t)
 
+diag1.close()
+diag2.close()
+diag3.close()
+diag4.close()
+
 # fig 5a
 dataset1 = Dataset(d_dirname1, mode="r")
 yaxis1 = dataset1.variables["energy"][:]
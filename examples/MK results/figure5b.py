@@ -99,6 +99,9 @@ for triangles in [50, 100, 200]:
 
         # fig 5b
 
+    diag1.close()
+    diag2.close()
+
     dataset1 = Dataset(d_dirname1, mode="r")
     yaxis1 = dataset1.variables["energy"][:]
     dataset1.close()
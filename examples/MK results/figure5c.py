@@ -100,6 +100,9 @@ for triangles in [50, 100, 200]:
 
     # fig 5c
 
+    diag1.close()
+    diag2.close()
+
     dataset1 = Dataset(d_dirname1, mode="r")
     yaxis1 = dataset1.variables["energy"][:]
     dataset1.close()
@@ -15,6 +15,7 @@ Initial conditions : u = 0, h = 1, A = x / L
 Boundary conditions : u = 0
 
 --test : one week of advection
+--restart : continue from the last checkpoint, adding to the output files
 """
 
 if "--test" in sys.argv:
@@ -24,12 +25,14 @@ if "--test" in sys.argv:
     week = 7 * day
     timescale = week
     dumpfreq = 3000
+    checkpointfreq = 5760
 
 else:
     number_of_triangles = 30
     timestep = 1
     dumpfreq = 100
     timescale = timestep * dumpfreq
+    checkpointfreq = None
 
 dirname = path + "/u_timescale={}_timestep={}.pvd".format(timescale, timestep)
 title = "EVP Fixed Energy Plot"
@@ -68,7 +71,13 @@ conditions = Conditions(
     advect=advect,
 )
 timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
-output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+restart = "--restart" in sys.argv
+output = OutputParameters(
+    dirname=dirname,
+    dumpfreq=dumpfreq,
+    checkpointfreq=checkpointfreq,
+    append=restart,
+)
 solver = SolverParameters()
 params = SeaIceParameters()
 
@@ -81,23 +90,28 @@ bt = ElasticViscousPlasticTransport(
     solver_params=solver,
 )
 
-diag = OutputDiagnostics(description="test 3", dirname=diagnostic_dirname)
+diag = OutputDiagnostics(
+    description="test 3", dirname=diagnostic_dirname, mode="a" if restart else "w"
+)
 
 
 d = Function(bt.D)
 
 t = 0
-while t < timescale - 0.5 * timestep:
-    bt.solve(bt.usolver)
-    bt.update(bt.w0, bt.w1)
-    diag.dump(bt.w1, t=t)
-    d.interpolate(bt.delta(bt.u1))
-    bt.dump(bt.u1, bt.a1, bt.h1, d, t=t)
-    t += timestep
+if restart:
+    t = bt.restore()
     t0.assign(t)
-    bt.progress(t)
 
 
+def forcing(model, t):
+    t0.assign(t)
+    d.interpolate(model.delta(model.u1))
+
+
+bt.run(t, callbacks=[forcing], diagnostics=diag, fields=(bt.u1, bt.a1, bt.h1, d))
+
+diag.close()
+
 plotter = Plotter(
     dataset_dirname=diagnostic_dirname,
     diagnostic="error",
@@ -17,7 +17,6 @@ number_of_triangles = 35
 length = 5 * 10 ** 5
 mesh = SquareMesh(number_of_triangles, number_of_triangles, length)
 x, y = SpatialCoordinate(mesh)
-c = Constant(0.1)
 
 pi_x = pi / length
 v_exp = as_vector([-sin(pi_x * x) * sin(pi_x * y), -sin(pi_x * x) * sin(pi_x * y)])
@@ -31,7 +30,6 @@ sigma = as_matrix(
 ocean_curr = as_vector(
     [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
 )
-ocean_curr = c * ocean_curr
 
 ic = {"u": 0, "a": x / length, "h": 1, "s": as_matrix([[0, 0], [0, 0]])}
 
@@ -59,26 +57,23 @@ evp = ElasticViscousPlastic(
 
 evp.assemble(evp.eqn, evp.w1, evp.bcs, solver.srt_params)
 
-evp.u1, evp.s1 = evp.w1.split()
-
 diag = OutputDiagnostics(description="test 1", dirname=diagnostic_dirname)
 
-t = 0
-
 d = Function(evp.D)
 
-while t < timescale - 0.5 * timestep:
-    u0, s0 = evp.w0.split()
-    evp.solve(evp.usolver)
-    evp.update(evp.w0, evp.w1)
-    diag.dump(evp.w1, t=t)
-    d.interpolate(evp.delta(evp.u1))
-    evp.dump(evp.u1, evp.s1, d, t=t)
-    t += timestep
-    c.assign(min_value(1, c + timestep ** (-3)))
-    # c.assign(conditional(lt(t,timescale/10),0.1,1))
-    evp.progress(t)
+# ramp the ocean forcing up from a tenth of its strength, the forms are
+# not rebuilt when the scale factor changes
+evp.ocean_scale.assign(0.1)
+
+
+def ramp(model, t):
+    model.ocean_scale.assign(min(1, float(model.ocean_scale) + timestep ** (-3)))
+    d.interpolate(model.delta(model.u1))
+
+
+evp.run(callbacks=[ramp], diagnostics=diag, fields=(evp.u1, evp.s1, d))
 
+diag.close()
 
 plotter = Plotter(
     dataset_dirname=diagnostic_dirname,
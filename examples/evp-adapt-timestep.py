@@ -19,7 +19,6 @@ Domain is a 500km x 500km square.
 """
 
 timestep = 1
-timestepc = Constant(timestep)
 dumpfreq = 10 ** 6
 timescale = 10 ** 4
 
@@ -56,7 +55,11 @@ conditions = Conditions(
 dirname = path + "/u_timescale={}_timestep={}_stabilised={}_family={}.pvd".format(
     timescale, timestep, conditions.stabilised["state"], conditions.family
 )
-timestepping = TimesteppingParameters(timescale=timescale, timestep=timestepc)
+# the timestep grows from 1s while the error estimate allows it
+adaptive = {"state": True, "method": "error", "tol": 1e-3, "max_timestep": 20}
+timestepping = TimesteppingParameters(
+    timescale=timescale, timestep=timestep, adaptive=adaptive
+)
 output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
 solver = SolverParameters()
 params = SeaIceParameters()
@@ -71,33 +74,25 @@ evp = ElasticViscousPlastic(
 
 evp.assemble(evp.eqn, evp.w1, evp.bcs, solver.srt_params)
 
-evp.u1, evp.s1 = evp.w1.split()
-
 diag = OutputDiagnostics(description="test 1", dirname=diagnostic_dirname)
 
-t = 0
-
 d = Function(evp.D)
 
+
+def delta(model, t):
+    d.interpolate(model.delta(model.u1))
+
+
 begin = time()
 
-while t < timescale - 0.5 * float(timestepc):
-    u0, s0 = evp.w0.split()
-    evp.solve(evp.usolver)
-    evp.update(evp.w0, evp.w1)
-    diag.dump(evp.w1, t=t)
-    d.interpolate(evp.delta(evp.u1))
-    evp.dump(evp.u1, evp.s1, d, t=t)
-    t += float(timestepc)
-    # timestepc.assign(timestepc+0.02)
-    # timestepc.assign(conditional(lt(t,2000),1,timestepc+0.5))
-    timestepc.assign(conditional(lt(t, 2000), 1, 20))
-    evp.progress(t)
+evp.run(callbacks=[delta], diagnostics=diag, fields=(evp.u1, evp.s1, d))
 
 end = time()
 
 print(end - begin)
+print(evp.controller.statistics())
 
+diag.close()
 
 plotter = Plotter(
     dataset_dirname=diagnostic_dirname,
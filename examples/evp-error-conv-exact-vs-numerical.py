@@ -231,6 +231,8 @@ for values in number_of_triangles:
         print(Error.compute(u1_num, u1_ex, norm_type))
         # print(Error.compute(evp.s1, x))
 
+    diag.close()
+
     error_values.append(Error.compute(u1_num, u1_ex, norm_type))
 
 h = [sqrt(2) * length / x for x in number_of_triangles]
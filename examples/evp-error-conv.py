@@ -152,6 +152,8 @@ for values in number_of_triangles:
         #print(Error.compute(u1, v_exp, norm_type))
         #print(Error.compute(s1, sigma_exp, norm_type)/norm(sigma_exp, norm_type))
 
+    diag.close()
+
     error_values.append(Error.compute(u1, v_exp, norm_type))
                         #norm(sigma_exp, norm_type))
 
@@ -149,6 +149,8 @@ for order in [1,2,3]:
             #print(Error.compute(u1, v_exp, norm_type))
             #print(Error.compute(s1, sigma_exp, norm_type)/norm(sigma_exp, norm_type))
 
+        diag.close()
+
         error_values.append(Error.compute(u1, v_exp, norm_type))
                         #norm(sigma_exp, norm_type))
 
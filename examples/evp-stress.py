@@ -57,6 +57,8 @@ while t < timescale - 0.5 * timestep:
     t += timestep
     evps.progress(t)
 
+diag.close()
+
 plotter = Plotter(
     dataset_dirname=diagnostic_dirname,
     diagnostic="energy",
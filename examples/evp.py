@@ -69,24 +69,18 @@ evp = ElasticViscousPlastic(
 
 evp.assemble(evp.eqn, evp.w1, evp.bcs, solver.srt_params)
 
-evp.u1, evp.s1 = evp.w1.split()
-
 diag = OutputDiagnostics(description="test 1", dirname=diagnostic_dirname)
 
-t = 0
-
 d = Function(evp.D)
 
-while t < timescale - 0.5 * timestep:
-    u0, s0 = evp.w0.split()
-    evp.solve(evp.usolver)
-    evp.update(evp.w0, evp.w1)
-    diag.dump(evp.w1, t=t)
-    d.interpolate(evp.delta(evp.u1))
-    evp.dump(evp.u1, evp.s1, d, t=t)
-    t += timestep
-    evp.progress(t)
 
+def strain_rate(model, t):
+    d.interpolate(model.delta(model.u1))
+
+
+evp.run(callbacks=[strain_rate], diagnostics=diag, fields=(evp.u1, evp.s1, d))
+
+diag.close()
 
 plotter = Plotter(
     dataset_dirname=diagnostic_dirname,
@@ -0,0 +1,92 @@
+from seaice import *
+from firedrake import *
+from pathlib import Path
+
+path = "./output/mevp-bt"
+Path(path).mkdir(parents=True, exist_ok=True)
+
+"""
+TEST 3 : BOX TEST (mEVP)
+
+Full momentum equation used, wind and ocean forcings present.
+Advection is switched off.
+Initial conditions : u = 0, h = 2, A = x / L
+Boundary conditions : u = 0
+
+mEVP with the FESIM operational timestep of 600 s and 100 subcycles.
+"""
+
+timestep = 600
+number_of_triangles = 30
+day = 60 * 60 * 24
+week = 7 * day
+timescale = week
+dumpfreq = 144
+
+dirname = path + "/u_timescale={}_timestep={}.pvd".format(timescale, timestep)
+title = "mEVP Energy Plot"
+diagnostic_dirname = path + "/box_test_energy_T={}_t={}.nc".format(timescale, timestep)
+plot_dirname = path + "/mEVP_box_test_energy_T={}_t={}.png".format(timescale, timestep)
+
+length = 10 ** 6
+mesh = SquareMesh(number_of_triangles, number_of_triangles, length)
+x, y = SpatialCoordinate(mesh)
+
+ocean_curr = as_vector(
+    [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+)
+t0 = Constant(0)
+geo_wind = as_vector(
+    [
+        5
+        + (sin(2 * pi * t0 / (4 * day)) - 3)
+        * sin(2 * pi * x / length)
+        * sin(2 * pi * y / length),
+        5
+        + (sin(2 * pi * t0 / (4 * day)) - 3)
+        * sin(2 * pi * y / length)
+        * sin(2 * pi * x / length),
+    ]
+)
+
+ic = {"u": 0, "h": 2, "a": x / length, "s": as_matrix([[0, 0], [0, 0]])}
+
+conditions = Conditions(
+    family="CG", geo_wind=geo_wind, ocean_curr=ocean_curr, ic=ic
+)
+timestepping = TimesteppingParameters(
+    timescale=timescale, timestep=timestep, subcycles=100
+)
+output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+solver = SolverParameters()
+params = SeaIceParameters(C_a=0.00225)
+
+mevp = ModifiedElasticViscousPlastic(
+    mesh=mesh,
+    conditions=conditions,
+    timestepping=timestepping,
+    output=output,
+    params=params,
+    solver_params=solver,
+)
+
+diag = OutputDiagnostics(description="mEVP box test", dirname=diagnostic_dirname)
+
+
+def forcing(model, t):
+    t0.assign(t)
+
+
+mevp.run(callbacks=[forcing], diagnostics=diag)
+
+diag.close()
+
+plotter = Plotter(
+    dataset_dirname=diagnostic_dirname,
+    diagnostic="energy",
+    plot_dirname=plot_dirname,
+    timestepping=timestepping,
+    title=title,
+)
+
+plotter.plot("semilogy")
@@ -71,3 +71,5 @@ for name in ["CG", "CR"]:
         evp.dump(evp.u1, evp.s1, t=t)
         t += timestep
         evp.progress(t)
+
+    diag.close()
@@ -1,3 +1,4 @@
+import sys
 from seaice import *
 from firedrake import *
 import numpy as np
@@ -7,13 +8,15 @@ from pathlib import Path
 path = "./output/srt-error-conv"
 Path(path).mkdir(parents=True, exist_ok=True)
 
+"""
+--processes N : run the resolutions in N worker processes
+Run under mpiexec to share the resolutions between the MPI ranks instead.
+"""
+
 timestep = 1
 dumpfreq = 10 ** 6
 timescale = 10
 
-zero = Constant(0)
-zero_vector = Constant(as_vector([0, 0]))
-
 norm_type = "H1"
 
 dirname = path + "/u.pvd"
@@ -21,17 +24,22 @@ plot_dirname = path + "/srt-conv_{}.pdf".format(norm_type)
 
 number_of_triangles = [5, 10, 20, 40, 80, 160]
 
-error_values = []
-
 length = 5 * 10 ** 5
 pi_x = pi / length
-timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
-output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
-solver = SolverParameters()
-params = SeaIceParameters(rho=1, rho_a=zero, C_a=zero, rho_w=zero, C_w=zero, cor=zero)
 
-for values in number_of_triangles:
-    mesh = SquareMesh(values, values, length)
+
+def setup(values, comm):
+    zero = Constant(0)
+    zero_vector = Constant(as_vector([0, 0]))
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    params = SeaIceParameters(
+        rho=1, rho_a=zero, C_a=zero, rho_w=zero, C_w=zero, cor=zero
+    )
+
+    mesh = SquareMesh(values, values, length, comm=comm)
     x, y = SpatialCoordinate(mesh)
     v_exp = as_vector([-sin(pi_x * x) * sin(pi_x * y), -sin(pi_x * x) * sin(pi_x * y)])
 
@@ -69,7 +77,7 @@ for values in number_of_triangles:
     )
     eqn += timestep * inner(div(sigma_exp), srt.p) * dx
 
-    srt.assemble(eqn, srt.u1, srt.bcs, solver.srt_params)
+    srt.assemble(eqn, srt.u1, srt.bcs, solver.test_params)
 
     t = 0
 
@@ -78,18 +86,28 @@ for values in number_of_triangles:
         srt.update(srt.u0, srt.u1)
         t += timestep
 
-    error_values.append(Error.compute(srt.u1, v_exp, norm_type))
+    return Error.compute(srt.u1, v_exp, norm_type)
+
+
+if __name__ == "__main__":
+    processes = None
+    if "--processes" in sys.argv:
+        processes = int(sys.argv[sys.argv.index("--processes") + 1])
+
+    study = ConvergenceStudy(setup, number_of_triangles, length)
+    error_values = study.run(processes=processes, comm=COMM_WORLD)
 
-h = [sqrt(2) * length / x for x in number_of_triangles]
-hsq = [10**-6 * x**2 for x in h]
-error_slope = float(format(np.polyfit(np.log(h), np.log(error_values), 1)[0], ".3f"))
+    h = study.h
+    hsq = [10**-6 * x**2 for x in h]
+    error_slope = float(format(study.slope(), ".3f"))
 
-print(error_slope)
+    print(error_slope)
 
-#plt.title("Strain Rate Tensor Error Convergence")
-plt.xlabel(r"h")
-plt.ylabel(r"$H^1$ Error".format(norm_type))
-plt.loglog(h, error_values, "-o", label="$H^1$ error")
-plt.loglog(h, hsq, label="$h^2$")
-plt.legend(loc='best')
-plt.savefig(plot_dirname)
+    if COMM_WORLD.rank == 0:
+        #plt.title("Strain Rate Tensor Error Convergence")
+        plt.xlabel(r"h")
+        plt.ylabel(r"$H^1$ Error".format(norm_type))
+        plt.loglog(h, error_values, "-o", label="$H^1$ error")
+        plt.loglog(h, hsq, label="$h^2$")
+        plt.legend(loc='best')
+        plt.savefig(plot_dirname)
@@ -104,6 +104,8 @@ while t < timescale - 0.5 * timestep:
 end = time()
 print(end - start, "[s]")
 
+diag.close()
+
 plotter = Plotter(
     dataset_dirname=diagnostic_dirname,
     diagnostic="error",
@@ -109,6 +109,8 @@ print(end - start, "[s]")
 
 Velocity.max_component(srt.u1, mesh)
 
+diag.close()
+
 plotter = Plotter(
     dataset_dirname=diagnostic_dirname,
     diagnostic="error",
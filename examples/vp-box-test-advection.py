@@ -89,6 +89,8 @@ while t < timescale - 0.5 * timestep:
     t0.assign(t)
     bt.progress(t)
 
+diag.close()
+
 plotter = Plotter(
     dataset_dirname=diagnostic_dirname,
     diagnostic="energy",
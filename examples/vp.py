@@ -60,3 +60,5 @@ while t < timescale - 0.5 * timestep:
     vp.dump(vp.u1, t=t)
     t += timestep
     vp.progress(t)
+
+diag.close()
@@ -1,4 +1,9 @@
 from seaice.config import *  # noqa
 from seaice.diagnostics import *  # noqa
 from seaice.models import *  # noqa
+from seaice.solvers import *  # noqa
+from seaice.timestepping import *  # noqa
+from seaice.profiling import *  # noqa
+from seaice.output import *  # noqa
+from seaice.convergence import *  # noqa
 from seaice.plotter import * # noqa
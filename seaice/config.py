@@ -26,22 +26,45 @@ class Configuration(object):
 
 class OutputParameters(Configuration):
     """
-    Output parameters
+    Output parameters, see OutputSchedule for how the dump options combine
     """
 
     dump_vtus = True
+    # steps between outputs, None for no step based output. Defaults to None
+    # if dumpinterval or dumplist is given
     dumpfreq = 10
-    dumplist = None
+    dumpinterval = None  # model seconds between outputs
+    dumplist = None  # model times to output at
+    triggers = None  # trigger(model, t) functions that request output
     dirname = None
+    append = False  # add to the output of an earlier run, e.g. on restart
+    checkpointfreq = None  # steps between checkpoints written by run()
+    checkpoint_dirname = None  # defaults to dirname with a _checkpoint suffix
+    profile = None  # file for the phase profile of run(), .json or .folded
+    dump_async = False  # write the VTUs on a background thread (serial runs)
+    dump_queue = 2  # snapshots that may wait for the background writer
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # a time based schedule replaces the default step based one
+        if "dumpfreq" not in kwargs and (self.dumpinterval or self.dumplist):
+            self.dumpfreq = None
 
 
 class TimesteppingParameters(Configuration):
     """
     Timestepping parameters
+
+    adaptive :: if "state" is switched on, run() changes the timestep after
+        every step, keyword arguments of AdaptiveTimestepController can be
+        added to the dict, e.g. {"state": True, "method": "iterations"}
     """
 
     timescale = None
     timestep = None
+    adaptive = {"state": False, "method": "error", "tol": 1e-3}
+    subcycles = 100  # pseudo-time subcycles per timestep (mEVP)
+    cfl = 0.2  # Courant number of the explicit transport substeps
 
 
 class SeaIceParameters(Configuration):
@@ -71,34 +94,246 @@ class SeaIceParameters(Configuration):
 class SolverParameters(Configuration):
     """
     Solver Parameters
+
+    Presets are stored as <name>_params and can be selected by name with
+    parameters(name). Models that build their own solvers use the preset
+    named by preset.
+
+    stress_update :: how ElasticViscousPlasticStress updates the stress,
+        "solve" projects it with a variational solver, "project" computes
+        the same projection with the DG mass matrix factorised once, and
+        "interpolate" evaluates the closed form at the nodes, which differs
+        from the projection where zeta and P vary within a cell
+    lag :: reuse the Jacobian and preconditioner of the nonlinear solvers
+        for up to "steps" timesteps, rebuilding early once a timestep
+        needs more than "max_its" Newton iterations
+    picard :: start the VP solves with up to "max_its" frozen-viscosity
+        Picard iterations, switching to Newton once the residual has dropped
+        by "rtol"
+    telemetry :: record the iterations, residual norms and time of every
+        nonlinear solve (see MonitoredSolver), "verbose" prints one line per
+        solve in place of the snes_monitor and ksp_monitor output
     """
 
+    preset = "bt"
+    stress_update = "solve"
+    lag = {"state": False, "steps": 10, "max_its": 5}
+    picard = {"state": False, "max_its": 10, "rtol": 1e-2}
+    telemetry = {"state": True, "verbose": False}
+
     test_params = {"ksp_type": "preonly", "pc_type": "lu", "mat_type": "aij"}
 
     srt_params = {
-        "ksp_monitor": None,
-        "snes_monitor": None,
         "ksp_type": "preonly",
         "pc_type": "lu",
     }
 
     bt_params = {
-        "ksp_monitor": None,
-        "snes_monitor": None,
         "ksp_type": "preonly",
         "pc_type": "lu",
         "mat_type": "aij",
     }
 
     fs_params = {
-        "ksp_type": "GMRES",
-        "pc_type": " fieldsplit",
+        "ksp_type": "gmres",
+        "mat_type": "aij",
+        "pc_type": "fieldsplit",
         "fieldsplit_0_ksp_type": "preonly",
         "fieldsplit_0_pc_type": "lu",
         "fieldsplit_1_ksp_type": "preonly",
         "fieldsplit_1_pc_type": "lu",
     }
 
+    # Schur complement for ElasticViscousPlastic, W1 = [V, S]. The DG stress
+    # is taken as the first split so that it is the block eliminated. It is
+    # cell-local, so ILU on it is an exact block-diagonal inverse, and only
+    # the velocity Schur complement is factorised.
+    evp_schur_params = {
+        "ksp_type": "fgmres",
+        "mat_type": "aij",
+        "pc_type": "fieldsplit",
+        "pc_fieldsplit_type": "schur",
+        "pc_fieldsplit_schur_fact_type": "full",
+        "pc_fieldsplit_schur_precondition": "selfp",
+        "pc_fieldsplit_0_fields": "1",
+        "pc_fieldsplit_1_fields": "0",
+        "fieldsplit_0_ksp_type": "preonly",
+        "fieldsplit_0_pc_type": "bjacobi",
+        "fieldsplit_0_sub_pc_type": "ilu",
+        "fieldsplit_1_ksp_type": "gmres",
+        "fieldsplit_1_ksp_rtol": 1e-8,
+        "fieldsplit_1_pc_type": "lu",
+    }
+
+    # ElasticViscousPlasticTransport, W3 = [V, S, U1, U1]. Momentum and stress
+    # are solved as for evp_schur, then the DG mass dominated h and a blocks
+    # get a block-Jacobi sweep.
+    evpt_schur_params = {
+        "ksp_type": "fgmres",
+        "mat_type": "aij",
+        "pc_type": "fieldsplit",
+        "pc_fieldsplit_type": "multiplicative",
+        "pc_fieldsplit_0_fields": "0,1",
+        "pc_fieldsplit_1_fields": "2,3",
+        "fieldsplit_0_ksp_type": "preonly",
+        "fieldsplit_0_pc_type": "fieldsplit",
+        "fieldsplit_0_pc_fieldsplit_type": "schur",
+        "fieldsplit_0_pc_fieldsplit_schur_fact_type": "full",
+        "fieldsplit_0_pc_fieldsplit_schur_precondition": "selfp",
+        "fieldsplit_0_pc_fieldsplit_0_fields": "1",
+        "fieldsplit_0_pc_fieldsplit_1_fields": "0",
+        "fieldsplit_0_fieldsplit_0_ksp_type": "preonly",
+        "fieldsplit_0_fieldsplit_0_pc_type": "bjacobi",
+        "fieldsplit_0_fieldsplit_0_sub_pc_type": "ilu",
+        "fieldsplit_0_fieldsplit_1_ksp_type": "gmres",
+        "fieldsplit_0_fieldsplit_1_ksp_rtol": 1e-8,
+        "fieldsplit_0_fieldsplit_1_pc_type": "lu",
+        "fieldsplit_1_ksp_type": "preonly",
+        "fieldsplit_1_pc_type": "bjacobi",
+        "fieldsplit_1_sub_pc_type": "ilu",
+    }
+
+    # the linear DG transport solves of the operator-split models
+    transport_params = {
+        "snes_type": "ksponly",
+        "ksp_type": "gmres",
+        "mat_type": "aij",
+        "pc_type": "bjacobi",
+        "sub_pc_type": "ilu",
+    }
+
+    # the block diagonal DG mass matrix of the explicit transport, where
+    # block Jacobi with ILU(0) is an exact inverse
+    dg_mass_params = {
+        "ksp_type": "preonly",
+        "mat_type": "aij",
+        "pc_type": "bjacobi",
+        "sub_pc_type": "ilu",
+    }
+
+    # operators that are assembled and factorised once, e.g. the mEVP
+    # velocity update
+    mass_params = {"ksp_type": "preonly", "pc_type": "lu", "mat_type": "aij"}
+
+    # iterative presets, for any of the models. PETSc's ILU is serial, so it
+    # is applied to each process's block through block Jacobi (which is plain
+    # ILU on one process)
+    gmres_ilu_params = {
+        "ksp_type": "gmres",
+        "ksp_gmres_restart": 100,
+        "pc_type": "bjacobi",
+        "sub_pc_type": "ilu",
+        "mat_type": "aij",
+    }
+
+    fgmres_asm_params = {
+        "ksp_type": "fgmres",
+        "ksp_gmres_restart": 100,
+        "pc_type": "asm",
+        "sub_pc_type": "ilu",
+        "mat_type": "aij",
+    }
+
+    # velocity only systems (ViscousPlastic and the momentum solve of
+    # ElasticViscousPlasticStress)
+    gmres_amg_params = {
+        "ksp_type": "gmres",
+        "ksp_gmres_restart": 100,
+        "pc_type": "gamg",
+        "mat_type": "aij",
+    }
+
+    # geometric multigrid for velocity only systems. Needs a mesh from a
+    # MeshHierarchy, on any other mesh the models fall back to gmres_amg.
+    vp_mg_params = {
+        "ksp_type": "fgmres",
+        "ksp_gmres_restart": 100,
+        "mat_type": "aij",
+        "pc_type": "mg",
+        "mg_levels_ksp_type": "chebyshev",
+        "mg_levels_ksp_max_it": 3,
+        "mg_levels_pc_type": "sor",
+        "mg_coarse_ksp_type": "preonly",
+        "mg_coarse_pc_type": "lu",
+    }
+
+    # mixed system W1 = [V, S]: ILU on each process's block of the velocity,
+    # block-Jacobi on the cell-local DG stress
+    bjacobi_params = {
+        "ksp_type": "fgmres",
+        "ksp_gmres_restart": 100,
+        "mat_type": "aij",
+        "pc_type": "fieldsplit",
+        "pc_fieldsplit_type": "additive",
+        "fieldsplit_0_ksp_type": "preonly",
+        "fieldsplit_0_pc_type": "bjacobi",
+        "fieldsplit_0_sub_pc_type": "ilu",
+        "fieldsplit_1_ksp_type": "preonly",
+        "fieldsplit_1_pc_type": "bjacobi",
+        "fieldsplit_1_sub_pc_type": "ilu",
+    }
+
+    # the same for W3 = [V, S, U1, U1], with block-Jacobi on the transport
+    # blocks as well
+    evpt_bjacobi_params = {
+        "ksp_type": "fgmres",
+        "ksp_gmres_restart": 100,
+        "mat_type": "aij",
+        "pc_type": "fieldsplit",
+        "pc_fieldsplit_type": "additive",
+        "fieldsplit_0_ksp_type": "preonly",
+        "fieldsplit_0_pc_type": "bjacobi",
+        "fieldsplit_0_sub_pc_type": "ilu",
+        "fieldsplit_1_ksp_type": "preonly",
+        "fieldsplit_1_pc_type": "bjacobi",
+        "fieldsplit_1_sub_pc_type": "ilu",
+        "fieldsplit_2_ksp_type": "preonly",
+        "fieldsplit_2_pc_type": "bjacobi",
+        "fieldsplit_2_sub_pc_type": "ilu",
+        "fieldsplit_3_ksp_type": "preonly",
+        "fieldsplit_3_pc_type": "bjacobi",
+        "fieldsplit_3_sub_pc_type": "ilu",
+    }
+
+    # Static condensation of the DG stress. The stress only couples within a
+    # cell, so it is eliminated element by element (Slate) and the global
+    # system only involves the velocity. SCPC condenses onto a single field,
+    # so this is for W1 = [V, S] only: ElasticViscousPlastic, and the
+    # momentum solve of ElasticViscousPlasticTransport with transport
+    # "split" or "explicit". The monolithic W3 system would be left with
+    # velocity, h and a.
+    evp_sc_params = {
+        "mat_type": "matfree",
+        "ksp_type": "preonly",
+        "pc_type": "python",
+        "pc_python_type": "firedrake.SCPC",
+        "pc_sc_eliminate_fields": "1",
+        "condensed_field": {
+            "mat_type": "aij",
+            "ksp_type": "preonly",
+            "pc_type": "lu",
+        },
+    }
+
+    def parameters(self, name=None):
+        """
+        Returns the solver parameters of the preset called name,
+        e.g. "bt" returns bt_params. Defaults to self.preset.
+        """
+        if name is None:
+            name = self.preset
+        try:
+            return getattr(self, name + "_params")
+        except AttributeError:
+            raise ValueError(
+                "Unknown solver preset '%s', choose from %s" % (name, self.presets())
+            )
+
+    def presets(self):
+        return sorted(
+            name[: -len("_params")] for name in dir(self) if name.endswith("_params")
+        )
+
 
 class Conditions(Configuration):
     """
@@ -116,3 +351,4 @@ class Conditions(Configuration):
     advect = None  # what variable do you want to advect?
     exact = False # exact or numerical initial condition
     order = 0  # order of the spaces
+    transport = "monolithic"  # "monolithic", "split" or "explicit" transport
@@ -0,0 +1,165 @@
+import multiprocessing
+import numpy as np
+from firedrake import COMM_SELF, COMM_WORLD, MeshHierarchy, SquareMesh, prolong
+
+__all__ = ["ConvergenceStudy", "HierarchyConvergenceStudy"]
+
+
+def run_level(setup, values):
+    return setup(values, COMM_WORLD)
+
+
+class ConvergenceStudy(object):
+    """
+    Runs a model at each resolution in number_of_triangles and fits the
+    order of convergence of the error.
+
+    setup(values, comm) builds a mesh with values triangles per side on comm,
+    runs the model and returns the error. The levels are independent, so they
+    can be run in a pool of processes (setup must then be a module level
+    function), or shared out between the ranks of an MPI job, with each level
+    running in serial on COMM_SELF. Levels are started largest first, so a
+    study takes roughly as long as its largest level.
+    """
+
+    def __init__(self, setup, number_of_triangles, length):
+        self.setup = setup
+        self.number_of_triangles = list(number_of_triangles)
+        self.length = length
+        self.errors = None
+
+    @property
+    def h(self):
+        return [
+            np.sqrt(2) * self.length / values for values in self.number_of_triangles
+        ]
+
+    def order(self):
+        """
+        level indices, largest resolution first
+        """
+        return sorted(
+            range(len(self.number_of_triangles)),
+            key=lambda i: self.number_of_triangles[i],
+            reverse=True,
+        )
+
+    def run(self, processes=None, comm=None):
+        """
+        processes :: number of worker processes, runs in serial if None or 1
+        comm :: MPI communicator whose ranks the levels are split between
+        """
+        if comm is not None and comm.size > 1:
+            errors = self.run_mpi(comm)
+        elif processes is not None and processes > 1:
+            errors = self.run_pool(processes)
+        else:
+            errors = [
+                self.setup(values, COMM_WORLD) for values in self.number_of_triangles
+            ]
+        self.errors = errors
+        return errors
+
+    def run_pool(self, processes):
+        order = self.order()
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes) as pool:
+            results = pool.starmap(
+                run_level,
+                [(self.setup, self.number_of_triangles[i]) for i in order],
+                chunksize=1,
+            )
+        errors = [None] * len(order)
+        for i, error in zip(order, results):
+            errors[i] = error
+        return errors
+
+    def run_mpi(self, comm):
+        local = {}
+        for i in self.order()[comm.rank :: comm.size]:
+            local[i] = self.setup(self.number_of_triangles[i], COMM_SELF)
+        errors = {}
+        for results in comm.allgather(local):
+            errors.update(results)
+        return [errors[i] for i in range(len(self.number_of_triangles))]
+
+    def slope(self):
+        if self.errors is None:
+            raise RuntimeError("Run the convergence study before fitting the slope")
+        return np.polyfit(np.log(self.h), np.log(self.errors), 1)[0]
+
+
+class HierarchyConvergenceStudy(ConvergenceStudy):
+    """
+    Convergence study over a nested MeshHierarchy built by refining a
+    base x base square refinements times, so the levels share topology and
+    transfer data instead of each building a fresh mesh.
+
+    setup(mesh, callbacks, initial_guess) builds the model on mesh, calls
+    model.run(callbacks=callbacks, initial_guess=initial_guess) and returns
+    the error. The callbacks record the solution after every step, by time,
+    and on all but the coarsest level initial_guess prolongs the previous
+    level's solution at the end time of the step into the new time level
+    before each solve, where it is the starting point of the Newton
+    iteration. A step with no coarse solution at its end time, e.g. one
+    repeated with a shorter timestep by the adaptive controller, starts from
+    the model's own guess.
+
+    Every level but the finest records the time levels of all its steps,
+    and each copy is dropped once the next level has passed its time. The
+    memory used therefore peaks at the whole trajectory of a level, one copy
+    of its time levels per step, plus what is left of the coarser one; for
+    the finest levels this is the trajectory of the second finest.
+    """
+
+    def __init__(self, setup, base, refinements, length):
+        number_of_triangles = [base * 2 ** i for i in range(refinements + 1)]
+        super().__init__(setup, number_of_triangles, length)
+        self.hierarchy = MeshHierarchy(SquareMesh(base, base, length), refinements)
+
+    def run(self):
+        errors = []
+        coarse = None
+        for level, mesh in enumerate(self.hierarchy):
+            solutions = {}
+            # nothing is prolonged from the finest level
+            if level < len(self.hierarchy) - 1:
+                callbacks = [self.record(solutions)]
+            else:
+                callbacks = []
+            if coarse is None:
+                initial_guess = None
+            else:
+                initial_guess = self.initial_guess(coarse)
+            errors.append(self.setup(mesh, callbacks, initial_guess))
+            coarse = solutions
+        self.errors = errors
+        return errors
+
+    @staticmethod
+    def record(solutions):
+        def callback(model, t):
+            solutions[t] = [
+                new_var.copy(deepcopy=True) for old_var, new_var in model.time_levels
+            ]
+
+        return callback
+
+    @staticmethod
+    def initial_guess(coarse):
+        def callback(model, t):
+            end = t + float(model.timestep)
+            tolerance = 1e-10 * (1 + abs(end))
+            # the coarse solutions before this step are no longer needed
+            for time in [time for time in coarse if time < t - tolerance]:
+                del coarse[time]
+            times = [time for time in coarse if abs(time - end) <= tolerance]
+            if not times:
+                return
+            for (old_var, new_var), coarse_var in zip(
+                model.time_levels, coarse[times[0]]
+            ):
+                for coarse_sub, fine_sub in zip(coarse_var.split(), new_var.split()):
+                    prolong(coarse_sub, fine_sub)
+
+        return callback
@@ -1,11 +1,13 @@
 from firedrake import *
-from netCDF4 import Dataset
 import time
+import os
 import numpy as np
 
 
 __all__ = ["Error", "Energy", "Velocity", "OutputDiagnostics"]
 
+telemetry_variables = ["newton_its", "linear_its", "residual", "seconds"]
+
 
 class Diagnostic(object):
     def __init__(self, v):
@@ -13,9 +15,26 @@ class Diagnostic(object):
 
 
 class Error(Diagnostic):
-    def __init__(self, v, solution):
+    """
+    Error between v and solution. The form is built once, so calling
+    evaluate() every timestep reuses the compiled kernel.
+    """
+
+    def __init__(self, v, solution, norm_type="L2"):
         super().__init__(v)
         self.solution = solution
+        self.norm_type = norm_type
+
+        e = solution - v
+        if norm_type == "L2":
+            self.form = inner(e, e) * dx
+        elif norm_type == "H1":
+            self.form = (inner(e, e) + inner(grad(e), grad(e))) * dx
+        else:
+            raise ValueError("Unknown norm type '%s'" % norm_type)
+
+    def evaluate(self):
+        return np.sqrt(assemble(self.form))
 
     @staticmethod
     def compute(v, solution, norm_type="L2"):
@@ -23,8 +42,17 @@ class Error(Diagnostic):
 
 
 class Energy(Diagnostic):
+    """
+    Energy of v. The form is built once, so calling evaluate() every
+    timestep reuses the compiled kernel.
+    """
+
     def __init__(self, v):
         super().__init__(v)
+        self.form = inner(grad(v), grad(v)) * dx
+
+    def evaluate(self):
+        return assemble(self.form)
 
     @staticmethod
     def compute(v):
@@ -58,30 +86,113 @@ class Velocity(Diagnostic):
 class OutputDiagnostics(object):
     """
     creates a netCDF file with all the diagnostic data
+
+    The file stays open for the whole run. Values are kept in an in-memory
+    buffer and written to the file in blocks of buffer_size timesteps, so
+    flush() or close() must be called (or the object used as a context
+    manager) before the file is read back.
+
+    mode :: "w" creates the file, "a" adds to the file of an earlier run
+        (e.g. when restarting from a checkpoint) and creates it if missing
     """
 
-    def __init__(self, dirname, description):
+    def __init__(self, dirname, description, buffer_size=100, mode="w"):
         self.dirname = dirname
         self.description = description
-
-        with Dataset(dirname, "w") as dataset:
-            dataset.description = "Diagnostics data for simulation {desc}".format(
-                desc=description
-            )
-            dataset.history = "Created {t}".format(t=time.ctime())
-            dataset.source = "Output from SeaIce Model"
-            dataset.createDimension("time", None)
-            times = dataset.createVariable("time", np.float64, ("time",))
-            times.units = "seconds"
-            dataset.createVariable("energy", np.float64, ("time",))
-            dataset.createVariable("error", np.float64, ("time",))
-
-    def dump(self, variable, t, solution=None):
-        with Dataset(self.dirname, "a") as dataset:
-            idx = dataset.dimensions["time"].size
-            dataset.variables["time"][idx : idx + 1] = t
-            energy = dataset.variables["energy"]
-            error = dataset.variables["error"]
-            energy[idx : idx + 1] = Energy.compute(variable)
-            if solution is not None:
-                error[idx : idx + 1] = Error.compute(variable, solution)
+        self.buffer_size = buffer_size
+        self.count = 0
+        self.energy_diagnostic = None
+        self.error_diagnostic = None
+
+        self.times = np.zeros(buffer_size)
+        self.energy = np.zeros(buffer_size)
+        self.error = np.ma.masked_all(buffer_size)
+        # convergence of the latest nonlinear solve, see MonitoredSolver
+        self.telemetry = {
+            name: np.ma.masked_all(buffer_size) for name in telemetry_variables
+        }
+
+        # netCDF4 is only needed once a diagnostics file is written
+        from netCDF4 import Dataset
+
+        if mode == "a" and os.path.exists(dirname):
+            self.dataset = Dataset(dirname, "a")
+            self.dataset.history += "\nAppended {t}".format(t=time.ctime())
+            return
+
+        self.dataset = Dataset(dirname, "w")
+        self.dataset.description = "Diagnostics data for simulation {desc}".format(
+            desc=description
+        )
+        self.dataset.history = "Created {t}".format(t=time.ctime())
+        self.dataset.source = "Output from SeaIce Model"
+        self.dataset.createDimension("time", None)
+        times = self.dataset.createVariable("time", np.float64, ("time",))
+        times.units = "seconds"
+        self.dataset.createVariable("energy", np.float64, ("time",))
+        self.dataset.createVariable("error", np.float64, ("time",))
+        for name in telemetry_variables:
+            self.dataset.createVariable(name, np.float64, ("time",))
+
+    def dump(self, variable, t, solution=None, telemetry=None):
+        """
+        telemetry :: record of the solve, as returned by MonitoredSolver.last()
+        """
+        idx = self.count
+        self.times[idx] = t
+        if self.energy_diagnostic is None or self.energy_diagnostic.v is not variable:
+            self.energy_diagnostic = Energy(variable)
+        self.energy[idx] = self.energy_diagnostic.evaluate()
+        if solution is not None:
+            if (
+                self.error_diagnostic is None
+                or self.error_diagnostic.v is not variable
+                or self.error_diagnostic.solution is not solution
+            ):
+                self.error_diagnostic = Error(variable, solution)
+            self.error[idx] = self.error_diagnostic.evaluate()
+        else:
+            self.error[idx] = np.ma.masked
+        for name in telemetry_variables:
+            if telemetry is None:
+                self.telemetry[name][idx] = np.ma.masked
+            else:
+                self.telemetry[name][idx] = telemetry[name]
+        self.count += 1
+        if self.count == self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        write the buffered values to the netCDF file
+        """
+        if self.dataset is None or self.count == 0:
+            return
+        idx = self.dataset.dimensions["time"].size
+        end = idx + self.count
+        self.dataset.variables["time"][idx:end] = self.times[: self.count]
+        self.dataset.variables["energy"][idx:end] = self.energy[: self.count]
+        self.dataset.variables["error"][idx:end] = self.error[: self.count]
+        for name, values in self.telemetry.items():
+            self.dataset.variables[name][idx:end] = values[: self.count]
+            values.mask = True
+        self.dataset.sync()
+        self.error.mask = True
+        self.count = 0
+
+    def close(self):
+        if self.dataset is None:
+            return
+        self.flush()
+        self.dataset.close()
+        self.dataset = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, "dataset", None) is not None:
+            self.close()
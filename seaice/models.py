@@ -1,3 +1,6 @@
+import os
+import warnings
+from time import perf_counter
 from firedrake import (
     FacetNormal,
     SpatialCoordinate,
@@ -12,9 +15,12 @@ from firedrake import (
     Function,
     TestFunctions,
     TestFunction,
+    TrialFunction,
+    TrialFunctions,
     NonlinearVariationalProblem,
     NonlinearVariationalSolver,
     File,
+    DumbCheckpoint,
     FILE_CREATE,
     FILE_READ,
     div,
@@ -31,28 +37,84 @@ from firedrake import (
     dot,
     avg,
     CellVolume,
+    CellDiameter,
     FacetArea,
     jump,
     norm,
     split,
     as_matrix,
+    derivative,
+    lhs,
+    rhs,
 )
+from firedrake.exceptions import ConvergenceError
+from firedrake.mg.utils import get_level
+from seaice.solvers import (
+    PointwiseSolver,
+    LinearUpdateSolver,
+    SubcycledSolver,
+    LaggedSolver,
+    PicardNewtonSolver,
+    SSPRK3Solver,
+    MonitoredSolver,
+)
+from seaice.timestepping import AdaptiveTimestepController
+from seaice.profiling import Profiler
+from seaice.output import AsyncOutputWriter, OutputSchedule, pvd_datasets
 
 
 class SeaIceModel(object):
+    # solver attributes and the profiling phases they are timed in
+    solver_roles = {"usolver": "momentum", "ssolver": "stress", "tsolver": "transport"}
+
     def __init__(self, mesh, conditions, timestepping, params, output, solver_params):
 
         self.timestepping = timestepping
-        self.timestep = timestepping.timestep
+        # Constants, so these can change without rebuilding the forms
+        if isinstance(timestepping.timestep, Constant):
+            self.timestep = timestepping.timestep
+        else:
+            self.timestep = Constant(timestepping.timestep)
+        if isinstance(conditions.theta, Constant):
+            self.theta = conditions.theta
+        else:
+            self.theta = Constant(conditions.theta)
+        # scale factors of the ocean and wind forcing
+        self.ocean_scale = Constant(1)
+        self.wind_scale = Constant(1)
+        self.controller = None
         self.timescale = timestepping.timescale
         self.params = params
         if output is None:
             raise RuntimeError("You must provide a directory name for dumping results")
         else:
             self.output = output
-        self.outfile = File(output.dirname)
-        self.dump_count = 0
+        if output.dump_async and mesh.comm.size > 1:
+            warnings.warn("dump_async is ignored in parallel, dumping in step")
+        if output.dump_async and mesh.comm.size == 1:
+            self.outfile = AsyncOutputWriter(
+                output.dirname, output.dump_queue, "a" if output.append else "w"
+            )
+        elif output.append and os.path.exists(output.dirname):
+            # number the new VTUs after the ones the .pvd already lists, so
+            # that the output from before a restart is not overwritten
+            restart = len(pvd_datasets(output.dirname))
+            self.outfile = File(output.dirname, mode="a", restart=restart)
+        else:
+            self.outfile = File(output.dirname)
         self.dump_freq = output.dumpfreq
+        self.schedule = OutputSchedule(
+            dumpfreq=output.dumpfreq,
+            dumpinterval=output.dumpinterval,
+            dumplist=output.dumplist,
+            triggers=output.triggers,
+        )
+        self.checkpoint_freq = output.checkpointfreq
+        if output.checkpoint_dirname is None:
+            self.checkpoint_dirname = output.dirname.rsplit(".", 1)[0] + "_checkpoint"
+        else:
+            self.checkpoint_dirname = output.checkpoint_dirname
+        self.profiler = Profiler(enabled=output.profile is not None)
         self.solver_params = solver_params
         self.mesh = mesh
         self.conditions = conditions
@@ -73,6 +135,7 @@ class SeaIceModel(object):
         self.W1 = MixedFunctionSpace([self.V, self.S])
         self.W2 = MixedFunctionSpace([self.V, self.U1, self.U1])
         self.W3 = MixedFunctionSpace([self.V, self.S, self.U1, self.U1])
+        self.W4 = MixedFunctionSpace([self.U1, self.U1])
 
     def Ice_Strength(self, h, a):
         return self.params.P_star * h * exp(-self.params.C * (1 - a))
@@ -80,6 +143,14 @@ class SeaIceModel(object):
     def zeta(self, h, a, delta):
         return 0.5 * self.Ice_Strength(h, a) / delta
 
+    def viscous_plastic_stress(self, zeta, ep_dot, P):
+        eta = zeta * self.params.e ** -2
+        return (
+            2 * eta * ep_dot
+            + (zeta - eta) * tr(ep_dot) * Identity(2)
+            - 0.5 * P * Identity(2)
+        )
+
     def strain(self, omega):
         return 0.5 * (omega + transpose(omega))
 
@@ -95,23 +166,124 @@ class SeaIceModel(object):
     def bcs(self, space, location="on_boundary"):
         return [DirichletBC(space, values, location) for values in self.conditions.bc]
 
+    @property
+    def solvers(self):
+        return [self.usolver]
+
+    def telemetry(self):
+        """
+        The record of the latest solve of the first monitored solver, or
+        None if no solver is monitored.
+        """
+        for solver in self.solvers:
+            if isinstance(solver, MonitoredSolver) and solver.seconds:
+                return solver.last()
+        return None
+
+    def set_timestep(self, timestep):
+        """
+        Changes the timestep of every form of the model, without recompiling.
+        """
+        self.timestep.assign(timestep)
+
     def solve(self, *args):
-        for solvers in args:
-            solvers.solve()
+        with self.profiler.phase("solve"):
+            for solvers in args:
+                with self.profiler.phase(self.role(solvers)):
+                    solvers.solve()
+
+    def role(self, solver):
+        """
+        Name of the phase solver is profiled in: what it solves for if it is
+        one of the model's solvers, otherwise its class name.
+        """
+        for name, role in self.solver_roles.items():
+            if getattr(self, name, None) is solver:
+                return role
+        return type(solver).__name__
 
     def update(self, old_var, new_var):
-        old_var.assign(new_var)
+        with self.profiler.phase("update"):
+            old_var.assign(new_var)
 
     def dump(self, *args, t):
-        self.dump_count += 1
-        if self.dump_count == self.dump_freq:
-            self.dump_count -= self.dump_freq
-            self.outfile.write(*args, time=t)
+        """
+        Writes the fields at time t if self.schedule says so.
+        """
+        if self.schedule.due(self, t):
+            with self.profiler.phase("dump"):
+                self.outfile.write(*args, time=t)
+
+    def checkpoint(self, t, path=None):
+        """
+        Saves every time level of the model, the fields of
+        checkpoint_fields(), the time, the timestep and any constant forcing
+        to an HDF5 checkpoint at path (without the .h5 extension).
+        """
+        if path is None:
+            path = self.checkpoint_dirname
+        with DumbCheckpoint(path, mode=FILE_CREATE) as chk:
+            for i, levels in enumerate(self.time_levels):
+                for level, func in zip(("old", "new"), levels):
+                    for j, sub in enumerate(func.split()):
+                        chk.store(sub, name="{}_{}_{}".format(level, i, j))
+            for name, func in self.checkpoint_fields().items():
+                chk.store(func, name=name)
+            chk.write_attribute("/", "time", t)
+            chk.write_attribute("/", "timestep", float(self.timestep))
+            for name, forcing in self.constant_forcing().items():
+                chk.write_attribute("/", name, forcing.values())
+
+    def restore(self, path=None):
+        """
+        Loads a checkpoint written by checkpoint() into the model and
+        returns the time it was taken at, so that the run can be continued
+        with run(t=restore(path)).
+        """
+        if path is None:
+            path = self.checkpoint_dirname
+        with DumbCheckpoint(path, mode=FILE_READ) as chk:
+            for i, levels in enumerate(self.time_levels):
+                for level, func in zip(("old", "new"), levels):
+                    for j, sub in enumerate(func.split()):
+                        chk.load(sub, name="{}_{}_{}".format(level, i, j))
+            for name, func in self.checkpoint_fields().items():
+                chk.load(func, name=name)
+            t = chk.read_attribute("/", "time")
+            if chk.has_attribute("/", "timestep"):
+                self.timestep.assign(chk.read_attribute("/", "timestep"))
+            for name, forcing in self.constant_forcing().items():
+                if chk.has_attribute("/", name):
+                    forcing.assign(chk.read_attribute("/", name))
+        return t
+
+    def checkpoint_fields(self):
+        """
+        State carried from step to step that is not in self.time_levels,
+        by checkpoint name.
+        """
+        return {}
+
+    def constant_forcing(self):
+        return {
+            name: forcing
+            for name, forcing in (
+                ("geo_wind", self.conditions.geo_wind),
+                ("ocean_curr", self.conditions.ocean_curr),
+                ("wind_scale", self.wind_scale),
+                ("ocean_scale", self.ocean_scale),
+            )
+            if isinstance(forcing, Constant)
+        }
 
     def initial_condition(self, exact, *args):
         """
         arguments should be put in order (variable1, ic1), (variable2, ic2), etc.
         """
+        with self.profiler.phase("initial_condition"):
+            self.set_initial_condition(exact, *args)
+
+    def set_initial_condition(self, exact, *args):
         for vars, ics in args:
             if exact:
                 if (
@@ -130,14 +302,202 @@ class SeaIceModel(object):
                 else:
                     vars.interpolate(ics)
 
-    def assemble(self, eqn, func, bcs, params):
-        uprob = NonlinearVariationalProblem(eqn, func, bcs)
-        self.usolver = NonlinearVariationalSolver(uprob, solver_parameters=params)
+    def assemble(self, eqn, func, bcs, params, picard=None):
+        """
+        params :: solver parameters, or the name of a SolverParameters preset
+        picard :: (picard_eqn, lagged function), see nonlinear_solver
+        """
+        self.usolver = self.nonlinear_solver(eqn, func, bcs, params, picard=picard)
+
+    def nonlinear_solver(self, eqn, func, bcs, params, picard=None):
+        """
+        Builds the solver for eqn = 0. If solver_params.lag is switched on the
+        solver reuses its Jacobian across timesteps (except for ksponly linear
+        solves), and if
+        solver_params.telemetry is switched on its convergence is recorded.
+
+        picard :: (picard_eqn, func_lag) where picard_eqn is eqn with the
+            viscosities evaluated at func_lag. If solver_params.picard is
+            switched on, each solve starts with Picard iterations using the
+            Jacobian of picard_eqn, with func_lag following the iterate,
+            before switching to Newton.
+        """
+        if isinstance(params, str):
+            params = self.solver_params.parameters(params)
+        # geometric multigrid needs a mesh hierarchy, otherwise use algebraic
+        if params.get("pc_type") == "mg" and get_level(self.mesh)[0] is None:
+            params = self.solver_params.gmres_amg_params
+        problem = NonlinearVariationalProblem(eqn, func, bcs)
+        solver = NonlinearVariationalSolver(problem, solver_parameters=params)
+
+        # a ksponly solve is a single linear solve, which a lagged Jacobian
+        # would make wrong rather than cheaper
+        lag = self.solver_params.lag
+        if lag["state"] and params.get("snes_type") != "ksponly":
+            solver = LaggedSolver(solver, func, lag["steps"], lag["max_its"])
+
+        settings = self.solver_params.picard
+        if settings["state"] and picard is not None:
+            picard_eqn, func_lag = picard
+            picard_params = dict(params)
+            picard_params.update(
+                {
+                    "snes_max_it": settings["max_its"],
+                    "snes_rtol": settings["rtol"],
+                    "snes_linesearch_type": "basic",
+                }
+            )
+            problem = NonlinearVariationalProblem(
+                eqn, func, bcs, J=derivative(picard_eqn, func)
+            )
+            picard_solver = NonlinearVariationalSolver(
+                problem,
+                solver_parameters=picard_params,
+                pre_jacobian_callback=lambda X: func_lag.assign(func),
+            )
+            solver = PicardNewtonSolver(picard_solver, solver)
+
+        telemetry = self.solver_params.telemetry
+        if telemetry["state"]:
+            solver = MonitoredSolver(solver, verbose=telemetry["verbose"])
+        return solver
 
     def progress(self, t):
         print("Time:", t, "[s]")
         print(int(min(t / self.timescale * 100, 100)), "% complete")
 
+    def run(
+        self,
+        t=0,
+        callbacks=None,
+        diagnostics=None,
+        solution=None,
+        fields=None,
+        initial_guess=None,
+    ):
+        """
+        Advance the model from time t until the end of the timescale.
+
+        callbacks :: functions called as callback(model, t) after every step
+        diagnostics :: OutputDiagnostics object, dumped every step
+        solution :: exact solution passed on to the diagnostics
+        fields :: fields written to the output file, defaults to self.output_fields
+        initial_guess :: function called as initial_guess(model, t) before every
+            solve, to set the starting point of the nonlinear solve
+
+        Returns the final time. The wall time spent in each phase of the step
+        is stored in self.timings and printed at the end of the run. If
+        output.checkpointfreq is set the model is checkpointed every
+        checkpointfreq steps. If timestepping.adaptive is switched on the
+        timestep is chosen by self.controller, which may repeat a step. If
+        output.profile is set, the phase profile of self.profiler is written
+        to that file at the end of the run.
+        """
+        if callbacks is None:
+            callbacks = []
+        if fields is None:
+            fields = self.output_fields
+
+        solvers = self.solvers
+        controller = self.timestep_controller()
+        self.schedule.reset(t)
+        self.timings = {"solve": 0, "update": 0, "diagnostics": 0, "output": 0}
+        step = 0
+
+        with self.profiler.phase("run"):
+            try:
+                while t < self.end_time(controller):
+                    if controller is not None:
+                        horizon = min(self.timescale, self.schedule.next_time())
+                        controller.begin(t, horizon)
+                    timestep = float(self.timestep)
+                    if initial_guess is not None:
+                        initial_guess(self, t)
+                    start = perf_counter()
+                    if controller is None:
+                        self.solve(*solvers)
+                        accepted = True
+                    else:
+                        try:
+                            self.solve(*solvers)
+                            converged = True
+                        except ConvergenceError:
+                            converged = False
+                        accepted = controller.accept(converged)
+                    end = perf_counter()
+                    self.timings["solve"] += end - start
+                    if not accepted:
+                        continue
+
+                    start = end
+                    for old_var, new_var in self.time_levels:
+                        self.update(old_var, new_var)
+                    t += timestep
+                    step += 1
+                    with self.profiler.phase("callbacks"):
+                        for callback in callbacks:
+                            callback(self, t)
+                    end = perf_counter()
+                    self.timings["update"] += end - start
+
+                    if diagnostics is not None:
+                        start = end
+                        with self.profiler.phase("diagnostics"):
+                            diagnostics.dump(
+                                self.u1, t, solution, telemetry=self.telemetry()
+                            )
+                        end = perf_counter()
+                        self.timings["diagnostics"] += end - start
+
+                    start = end
+                    self.dump(*fields, t=t)
+                    if self.dump_freq and step % self.dump_freq == 0:
+                        self.progress(t)
+                    if self.checkpoint_freq and step % self.checkpoint_freq == 0:
+                        with self.profiler.phase("checkpoint"):
+                            self.checkpoint(t)
+                    self.timings["output"] += perf_counter() - start
+            finally:
+                if diagnostics is not None:
+                    diagnostics.flush()
+                # the next run() starts the writer thread again
+                if isinstance(self.outfile, AsyncOutputWriter):
+                    self.outfile.close()
+
+        self.timing_report()
+        if self.output.profile is not None and self.mesh.comm.rank == 0:
+            self.profiler.write(self.output.profile)
+        return t
+
+    def end_time(self, controller):
+        """
+        run() steps while t is below this. With a fixed timestep the run
+        ends within half a step of timescale. With a controller, which clips
+        the last step to timescale, it ends at timescale.
+        """
+        if controller is None:
+            return self.timescale - 0.5 * float(self.timestep)
+        return self.timescale - 1e-10 * (1 + abs(self.timescale))
+
+    def timestep_controller(self):
+        """
+        Builds self.controller on the first call if timestepping.adaptive is
+        switched on, otherwise returns None.
+        """
+        adaptive = dict(self.timestepping.adaptive)
+        if not adaptive.pop("state"):
+            return None
+        if self.controller is None:
+            self.controller = AdaptiveTimestepController(self, **adaptive)
+        return self.controller
+
+    def timing_report(self):
+        total = sum(self.timings.values())
+        print("Wall time per phase [s]:")
+        for phase, seconds in self.timings.items():
+            share = 100 * seconds / total if total > 0 else 0
+            print("  {:<12} {:10.3f} ({:5.1f}%)".format(phase, seconds, share))
+
     def momentum_equation(
         self,
         hh,
@@ -157,6 +517,9 @@ class SeaIceModel(object):
         timestep,
         ind=1,
     ):
+        ocean_curr = self.ocean_scale * ocean_curr
+        geo_wind = self.wind_scale * geo_wind
+
         def momentum_term():
             return inner(rho * hh * (u1 - u0), p) * dx
 
@@ -178,25 +541,54 @@ class SeaIceModel(object):
             - stress_term(rho_a, C_a, geo_wind)
         )
 
+    def upwind_term(self, u, var, test, n, timestep):
+        un = 0.5 * (dot(u, n) + abs(dot(u, n)))
+        return timestep * (
+            var * div(test * u) * dx
+            - (test("+") - test("-")) * (un("+") * var("+") - un("-") * var("-")) * dS
+        )
+
     def transport_equation(self, uh, hh, ah, h1, h0, a1, a0, q, r, n, timestep):
         def in_term(var1, var2, test):
             trial = var2 - var1
             return test * trial * dx
 
-        def upwind_term(var1, test):
-            un = 0.5 * (dot(uh, n) + abs(dot(uh, n)))
-            return timestep * (
-                var1 * div(test * uh) * dx
-                - (test("+") - test("-"))
-                * (un("+") * ah("+") - un("-") * var1("-"))
-                * dS
-            )
-
         return (
             in_term(h0, h1, q)
-            - upwind_term(hh, q)
+            - self.upwind_term(uh, hh, q, n, timestep)
             + in_term(a0, a1, r)
-            - upwind_term(ah, r)
+            - self.upwind_term(uh, ah, r, n, timestep)
+        )
+
+    def explicit_transport_solver(self, u, ha0, ha1):
+        """
+        Upwind DG transport of ha = (h, a) from ha0 into ha1 with the fixed
+        velocity u, using SSPRK3 subcycled to timestepping.cfl. Each stage
+        is a right hand side assembly and a DG mass matrix inverse.
+        """
+        space = ha1.function_space()
+        h1, a1 = split(ha1)
+        dh, da = TrialFunctions(space)
+        q, r = TestFunctions(space)
+
+        dt = Constant(float(self.timestep))
+        a = (dh * q + da * r) * dx
+        L = self.upwind_term(u, h1, q, self.n, dt) + self.upwind_term(
+            u, a1, r, self.n, dt
+        )
+        increment = LinearUpdateSolver(
+            a,
+            L,
+            Function(space),
+            solver_parameters=self.solver_params.parameters("dg_mass"),
+        )
+
+        diameter = Function(self.D).interpolate(CellDiameter(self.mesh))
+        with diameter.dat.vec_ro as v:
+            hmin = v.min()[1]
+
+        return SSPRK3Solver(
+            increment, ha0, ha1, u, dt, self.timestep, hmin, self.timestepping.cfl
         )
 
     def stabilisation_term(self, alpha, zeta, mesh, v, test):
@@ -215,7 +607,7 @@ class ViscousPlastic(SeaIceModel):
 
         self.p = TestFunction(self.V)
 
-        theta = conditions.theta
+        theta = self.theta
         self.uh = (1 - theta) * self.u0 + theta * self.u1
 
         ep_dot = self.strain(grad(self.uh))
@@ -228,40 +620,49 @@ class ViscousPlastic(SeaIceModel):
             (self.h, conditions.ic["h"]),
         )
 
-        zeta = self.zeta(self.h, self.a, self.delta(self.uh))
-        eta = zeta * params.e ** -2
-        sigma = (
-            2 * eta * ep_dot
-            + (zeta - eta) * tr(ep_dot) * Identity(2)
-            - 0.5 * self.Ice_Strength(self.h, self.a) * Identity(2)
-        )
+        # Picard iterations freeze the viscosities at u_lag
+        self.u_lag = Function(self.V)
+        uh_lag = (1 - theta) * self.u0 + theta * self.u_lag
 
-        self.eqn = self.momentum_equation(
-            self.h,
-            self.u1,
-            self.u0,
-            self.p,
-            sigma,
-            params.rho,
-            self.uh,
-            conditions.ocean_curr,
-            params.rho_a,
-            params.C_a,
-            params.rho_w,
-            params.C_w,
-            conditions.geo_wind,
-            params.cor,
-            self.timestep,
-        )
+        zeta = self.zeta(self.h, self.a, self.delta(self.uh))
+        zeta_lag = self.zeta(self.h, self.a, self.delta(uh_lag))
 
-        if conditions.stabilised["state"]:
-            alpha = conditions.stabilised["alpha"]
-            self.eqn += self.stabilisation_term(
-                alpha=alpha, zeta=avg(zeta), mesh=mesh, v=self.uh, test=self.p
+        def equation(zeta):
+            sigma = self.viscous_plastic_stress(
+                zeta, ep_dot, self.Ice_Strength(self.h, self.a)
+            )
+            eqn = self.momentum_equation(
+                self.h,
+                self.u1,
+                self.u0,
+                self.p,
+                sigma,
+                params.rho,
+                self.uh,
+                conditions.ocean_curr,
+                params.rho_a,
+                params.C_a,
+                params.rho_w,
+                params.C_w,
+                conditions.geo_wind,
+                params.cor,
+                self.timestep,
             )
+            if conditions.stabilised["state"]:
+                alpha = conditions.stabilised["alpha"]
+                eqn += self.stabilisation_term(
+                    alpha=alpha, zeta=avg(zeta), mesh=mesh, v=self.uh, test=self.p
+                )
+            return eqn
+
+        self.eqn = equation(zeta)
+        self.picard = (equation(zeta_lag), self.u_lag)
 
         self.bcs = DirichletBC(self.V, conditions.bc["u"], "on_boundary")
 
+        self.time_levels = [(self.u0, self.u1)]
+        self.output_fields = (self.u1,)
+
 
 class ViscousPlasticTransport(SeaIceModel):
     def __init__(self, mesh, conditions, timestepping, params, output, solver_params):
@@ -285,56 +686,68 @@ class ViscousPlasticTransport(SeaIceModel):
         u1, h1, a1 = split(self.w1)
         u0, h0, a0 = split(self.w0)
 
-        theta = conditions.theta
+        theta = self.theta
         uh = (1 - theta) * u0 + theta * u1
         ah = (1 - theta) * a0 + theta * a1
         hh = (1 - theta) * h0 + theta * h1
 
+        # Picard iterations freeze the viscosities at w_lag
+        self.w_lag = Function(self.W2)
+        u_lag, h_lag, a_lag = split(self.w_lag)
+        uh_lag = (1 - theta) * u0 + theta * u_lag
+        ah_lag = (1 - theta) * a0 + theta * a_lag
+        hh_lag = (1 - theta) * h0 + theta * h_lag
+
         ep_dot = self.strain(grad(uh))
         zeta = self.zeta(hh, ah, self.delta(uh))
-        eta = zeta * params.e ** (-2)
-        sigma = (
-            2 * eta * ep_dot
-            + (zeta - eta) * tr(ep_dot) * Identity(2)
-            - self.Ice_Strength(hh, ah) * 0.5 * Identity(2)
-        )
+        zeta_lag = self.zeta(hh_lag, ah_lag, self.delta(uh_lag))
 
-        eqn = self.momentum_equation(
-            hh,
-            u1,
-            u0,
-            p,
-            sigma,
-            params.rho,
-            uh,
-            conditions.ocean_curr,
-            params.rho_a,
-            params.C_a,
-            params.rho_w,
-            params.C_w,
-            conditions.geo_wind,
-            params.cor,
-            self.timestep,
-        )
-        eqn += self.transport_equation(
-            uh, hh, ah, h1, h0, a1, a0, q, r, self.n, self.timestep
-        )
-
-        if conditions.stabilised["state"]:
-            alpha = conditions.stabilised["alpha"]
-            eqn += self.stabilisation_term(
-                alpha=alpha, zeta=avg(zeta), mesh=mesh, v=uh, test=p
+        def equation(zeta):
+            sigma = self.viscous_plastic_stress(
+                zeta, ep_dot, self.Ice_Strength(hh, ah)
             )
+            eqn = self.momentum_equation(
+                hh,
+                u1,
+                u0,
+                p,
+                sigma,
+                params.rho,
+                uh,
+                conditions.ocean_curr,
+                params.rho_a,
+                params.C_a,
+                params.rho_w,
+                params.C_w,
+                conditions.geo_wind,
+                params.cor,
+                self.timestep,
+            )
+            eqn += self.transport_equation(
+                uh, hh, ah, h1, h0, a1, a0, q, r, self.n, self.timestep
+            )
+            if conditions.stabilised["state"]:
+                alpha = conditions.stabilised["alpha"]
+                eqn += self.stabilisation_term(
+                    alpha=alpha, zeta=avg(zeta), mesh=mesh, v=uh, test=p
+                )
+            return eqn
+
+        eqn = equation(zeta)
+        self.picard = (equation(zeta_lag), self.w_lag)
 
         bcs = DirichletBC(self.W2.sub(0), conditions.bc["u"], "on_boundary")
 
-        uprob = NonlinearVariationalProblem(eqn, self.w1, bcs)
-        self.usolver = NonlinearVariationalSolver(
-            uprob, solver_parameters=solver_params.bt_params
+        self.usolver = self.nonlinear_solver(
+            eqn, self.w1, bcs, solver_params.preset, picard=self.picard
         )
 
+        self.u0, self.h0, self.a0 = self.w0.split()
         self.u1, self.h1, self.a1 = self.w1.split()
 
+        self.time_levels = [(self.w0, self.w1)]
+        self.output_fields = (self.u1, self.h1, self.a1)
+
 
 class ElasticViscousPlastic(SeaIceModel):
     def __init__(self, mesh, conditions, timestepping, params, output, solver_params):
@@ -360,7 +773,7 @@ class ElasticViscousPlastic(SeaIceModel):
         u1, s1 = split(self.w1)
         u0, s0 = split(self.w0)
 
-        theta = conditions.theta
+        theta = self.theta
         uh = (1 - theta) * u0 + theta * u1
         sh = (1 - theta) * s0 + theta * s1
 
@@ -405,7 +818,10 @@ class ElasticViscousPlastic(SeaIceModel):
 
         self.bcs = DirichletBC(self.W1.sub(0), conditions.bc["u"], "on_boundary")
 
-        # u1, s1 = self.w1.split()
+        self.u1, self.s1 = self.w1.split()
+
+        self.time_levels = [(self.w0, self.w1)]
+        self.output_fields = (self.u1, self.s1)
 
 
 class ElasticViscousPlasticStress(SeaIceModel):
@@ -418,7 +834,7 @@ class ElasticViscousPlasticStress(SeaIceModel):
         self.sigma0 = Function(self.S)
         self.sigma1 = Function(self.S)
 
-        theta = conditions.theta
+        theta = self.theta
         uh = (1 - theta) * self.u0 + theta * self.u1
 
         a = Function(self.U)
@@ -443,7 +859,9 @@ class ElasticViscousPlasticStress(SeaIceModel):
             - 0.5 * self.Ice_Strength(h, a) * Identity(2)
         )
 
-        self.initial_condition((self.sigma0, rheology), (self.sigma1, self.sigma0))
+        self.initial_condition(
+            conditions.exact, (self.sigma0, rheology), (self.sigma1, self.sigma0)
+        )
 
         def sigma_next(timestep, zeta, ep_dot, sigma, P):
             A = 1 + 0.25 * (timestep * params.e ** 2) / params.T
@@ -493,32 +911,81 @@ class ElasticViscousPlasticStress(SeaIceModel):
 
         if conditions.stabilised["state"]:
             alpha = conditions.stabilised["alpha"]
-            eqn += stabilisation_term(
+            eqn += self.stabilisation_term(
                 alpha=alpha, zeta=avg(zeta), mesh=mesh, v=uh, test=p
             )
 
         bcs = DirichletBC(self.V, conditions.bc["u"], "on_boundary")
 
-        uprob = NonlinearVariationalProblem(eqn, self.u1, bcs)
-        self.usolver = NonlinearVariationalSolver(
-            uprob, solver_parameters=solver_params.bt_params
-        )
-        sprob = NonlinearVariationalProblem(tensor_eqn, self.sigma1)
-        self.ssolver = NonlinearVariationalSolver(
-            sprob, solver_parameters=solver_params.bt_params
-        )
+        self.usolver = self.nonlinear_solver(eqn, self.u1, bcs, solver_params.preset)
+        # the stress update is explicit and DG, so its projection only needs
+        # the block diagonal mass matrix, factorised once. Interpolating it
+        # instead is cheaper still but is not the same discretisation, as
+        # zeta and P vary within a cell.
+        if solver_params.stress_update == "project":
+            self.ssolver = LinearUpdateSolver(
+                inner(TrialFunction(self.S), q) * dx,
+                inner(s, q) * dx,
+                self.sigma1,
+                solver_parameters=solver_params.dg_mass_params,
+            )
+        elif solver_params.stress_update == "interpolate":
+            self.ssolver = PointwiseSolver(s, self.sigma1)
+        elif solver_params.stress_update == "solve":
+            self.ssolver = self.nonlinear_solver(
+                tensor_eqn, self.sigma1, None, solver_params.preset
+            )
+        else:
+            raise ValueError(
+                "Unknown stress update '%s'" % solver_params.stress_update
+            )
+
+        self.time_levels = [(self.u0, self.u1), (self.sigma0, self.sigma1)]
+        self.output_fields = (self.u1, self.sigma1)
+
+    @property
+    def solvers(self):
+        return [self.usolver, self.ssolver]
 
 
 class ElasticViscousPlasticTransport(SeaIceModel):
+    """
+    With conditions.transport = "monolithic" momentum, stress, h and a are
+    solved together in W3. With "split" each timestep solves momentum and
+    stress in W1 with h and a frozen at the old time level, then advances h
+    and a in W4 with the new velocity using the cheap DG transport solve.
+    "explicit" replaces that solve with subcycled SSPRK3 steps, see
+    explicit_transport_solver.
+    """
+
     def __init__(self, mesh, conditions, timestepping, params, output, solver_params):
         super().__init__(mesh, conditions, timestepping, params, output, solver_params)
 
-        self.w0 = Function(self.W3)
-        self.w1 = Function(self.W3)
+        if conditions.transport not in ("monolithic", "split", "explicit"):
+            raise ValueError(
+                "Unknown transport %s, use 'monolithic', 'split' or 'explicit'"
+                % conditions.transport
+            )
+        split_transport = conditions.transport != "monolithic"
+
+        if split_transport:
+            self.w0 = Function(self.W1)
+            self.w1 = Function(self.W1)
+            self.ha0 = Function(self.W4)
+            self.ha1 = Function(self.W4)
 
-        u0, s0, h0, a0 = self.w0.split()
+            u0, s0 = self.w0.split()
+            h0, a0 = self.ha0.split()
+
+            p, q = TestFunctions(self.W1)
+            r, m = TestFunctions(self.W4)
+        else:
+            self.w0 = Function(self.W3)
+            self.w1 = Function(self.W3)
 
-        p, q, r, m = TestFunctions(self.W3)
+            u0, s0, h0, a0 = self.w0.split()
+
+            p, q, r, m = TestFunctions(self.W3)
 
         self.initial_condition(
             conditions.exact,
@@ -530,14 +997,27 @@ class ElasticViscousPlasticTransport(SeaIceModel):
 
         self.w1.assign(self.w0)
 
-        u1, s1, h1, a1 = split(self.w1)
-        u0, s0, h0, a0 = split(self.w0)
+        theta = self.theta
+        if split_transport:
+            self.ha1.assign(self.ha0)
+
+            u1, s1 = split(self.w1)
+            u0, s0 = split(self.w0)
+            h1, a1 = split(self.ha1)
+            h0, a0 = split(self.ha0)
+
+            # h and a are frozen during the momentum solve
+            hh = h0
+            ah = a0
+        else:
+            u1, s1, h1, a1 = split(self.w1)
+            u0, s0, h0, a0 = split(self.w0)
+
+            hh = (1 - theta) * h0 + theta * h1
+            ah = (1 - theta) * a0 + theta * a1
 
-        theta = conditions.theta
         uh = (1 - theta) * u0 + theta * u1
         sh = (1 - theta) * s0 + theta * s1
-        hh = (1 - theta) * h0 + theta * h1
-        ah = (1 - theta) * a0 + theta * a1
 
         ep_dot = self.strain(grad(uh))
         zeta = self.zeta(hh, ah, self.delta(uh))
@@ -564,9 +1044,6 @@ class ElasticViscousPlasticTransport(SeaIceModel):
             self.timestep,
             ind=self.ind,
         )
-        eqn += self.transport_equation(
-            uh, hh, ah, h1, h0, a1, a0, r, m, self.n, self.timestep
-        )
         eqn += (
             inner(self.ind * (s1 - s0) + 0.5 * self.timestep * rheology / params.T, q)
             * dx
@@ -579,11 +1056,142 @@ class ElasticViscousPlasticTransport(SeaIceModel):
                 alpha=alpha, zeta=avg(zeta), mesh=mesh, v=uh, test=p
             )
 
-        bcs = DirichletBC(self.W3.sub(0), conditions.bc["u"], "on_boundary")
+        if conditions.transport == "explicit":
+            self.tsolver = self.explicit_transport_solver(
+                self.w1.split()[0], self.ha0, self.ha1
+            )
+
+            bcs = DirichletBC(self.W1.sub(0), conditions.bc["u"], "on_boundary")
+        elif split_transport:
+            hh = (1 - theta) * h0 + theta * h1
+            ah = (1 - theta) * a0 + theta * a1
+            transport_eqn = self.transport_equation(
+                uh, hh, ah, h1, h0, a1, a0, r, m, self.n, self.timestep
+            )
+            self.tsolver = self.nonlinear_solver(
+                transport_eqn, self.ha1, None, "transport"
+            )
+
+            bcs = DirichletBC(self.W1.sub(0), conditions.bc["u"], "on_boundary")
+        else:
+            eqn += self.transport_equation(
+                uh, hh, ah, h1, h0, a1, a0, r, m, self.n, self.timestep
+            )
+            self.tsolver = None
+
+            bcs = DirichletBC(self.W3.sub(0), conditions.bc["u"], "on_boundary")
+
+        self.usolver = self.nonlinear_solver(eqn, self.w1, bcs, solver_params.preset)
+
+        if split_transport:
+            self.u0, self.s0 = self.w0.split()
+            self.u1, self.s1 = self.w1.split()
+            self.h0, self.a0 = self.ha0.split()
+            self.h1, self.a1 = self.ha1.split()
+
+            self.time_levels = [(self.w0, self.w1), (self.ha0, self.ha1)]
+        else:
+            self.u0, self.s0, self.h0, self.a0 = self.w0.split()
+            self.u1, self.s1, self.h1, self.a1 = self.w1.split()
+
+            self.time_levels = [(self.w0, self.w1)]
+        self.output_fields = (self.u1, self.s1, self.h1, self.a1)
+
+    @property
+    def solvers(self):
+        if self.tsolver is None:
+            return [self.usolver]
+        return [self.usolver, self.tsolver]
+
+
+class ModifiedElasticViscousPlastic(SeaIceModel):
+    """
+    mEVP: each timestep is approximated by timestepping.subcycles explicit
+    pseudo-time iterations relaxed by the constants alpha and beta,
 
-        uprob = NonlinearVariationalProblem(eqn, self.w1, bcs)
-        self.usolver = NonlinearVariationalSolver(
-            uprob, solver_parameters=solver_params.bt_params
+        sigma^{p+1} = sigma^p + (sigma(u^p) - sigma^p) / alpha
+        beta (u^{p+1} - u^p) = u^n - u^{p+1} + timestep / (rho h) F(sigma^{p+1}, u^p)
+
+    The velocity operator is assembled and factorised once, so a subcycle is
+    one pointwise stress update and one right hand side assembly.
+    """
+
+    def __init__(self, mesh, conditions, timestepping, params, output, solver_params):
+        super().__init__(mesh, conditions, timestepping, params, output, solver_params)
+
+        self.u0 = Function(self.V)
+        self.u1 = Function(self.V)
+        self.s1 = Function(self.S)
+        self.a = Function(self.U)
+        self.h = Function(self.U)
+
+        u = TrialFunction(self.V)
+        p = TestFunction(self.V)
+
+        self.initial_condition(
+            conditions.exact,
+            (self.u0, conditions.ic["u"]),
+            (self.u1, self.u0),
+            (self.s1, conditions.ic.get("s", 0)),
+            (self.a, conditions.ic["a"]),
+            (self.h, conditions.ic["h"]),
+        )
+
+        ep_dot = self.strain(grad(self.u1))
+        zeta = self.zeta(self.h, self.a, self.delta(self.u1))
+        eta = zeta * params.e ** -2
+        sigma = (
+            2 * eta * ep_dot
+            + (zeta - eta) * tr(ep_dot) * Identity(2)
+            - 0.5 * self.Ice_Strength(self.h, self.a) * Identity(2)
         )
 
-        self.u1, self.s0, self.h1, self.a1 = self.w1.split()
+        stress_update = PointwiseSolver(
+            self.s1 + (sigma - self.s1) / params.alpha, self.s1
+        )
+
+        eqn = params.beta * inner(params.rho * self.h * (u - self.u1), p) * dx
+        eqn += self.momentum_equation(
+            self.h,
+            u,
+            self.u0,
+            p,
+            self.s1,
+            params.rho,
+            self.u1,
+            conditions.ocean_curr,
+            params.rho_a,
+            params.C_a,
+            params.rho_w,
+            params.C_w,
+            conditions.geo_wind,
+            params.cor,
+            self.timestep,
+        )
+
+        if conditions.stabilised["state"]:
+            alpha = conditions.stabilised["alpha"]
+            eqn += self.stabilisation_term(
+                alpha=alpha, zeta=avg(zeta), mesh=mesh, v=self.u1, test=p
+            )
+
+        self.bcs = DirichletBC(self.V, conditions.bc["u"], "on_boundary")
+
+        velocity_update = LinearUpdateSolver(
+            lhs(eqn),
+            rhs(eqn),
+            self.u1,
+            bcs=self.bcs,
+            solver_parameters=solver_params.mass_params,
+        )
+
+        self.usolver = SubcycledSolver(
+            timestepping.subcycles, stress_update, velocity_update
+        )
+
+        self.time_levels = [(self.u0, self.u1)]
+        self.output_fields = (self.u1, self.s1)
+
+    def checkpoint_fields(self):
+        # the subcycles start from the stress of the previous step
+        return {"s1": self.s1}
@@ -0,0 +1,351 @@
+import os
+import sys
+import queue
+import threading
+from math import floor, inf
+from xml.etree import ElementTree
+import numpy as np
+from firedrake import (
+    Function,
+    FunctionSpace,
+    VectorFunctionSpace,
+    TensorFunctionSpace,
+    SpatialCoordinate,
+    triangle,
+)
+from pyop2.mpi import MPI
+
+__all__ = ["AsyncOutputWriter", "OutputSchedule", "VelocityThreshold"]
+
+
+def pvd_datasets(filename):
+    """
+    The (time, file) of each dataset in the .pvd collection filename, or an
+    empty list if there is no such file.
+    """
+    if not os.path.exists(filename):
+        return []
+    collection = ElementTree.parse(filename).getroot().find("Collection")
+    return [
+        (float(dataset.get("timestep")), dataset.get("file")) for dataset in collection
+    ]
+
+
+class AsyncOutputWriter(object):
+    """
+    Writes the fields to filename, a .pvd collection of .vtu files like a
+    firedrake File, with the file writing on a background thread, so that
+    output overlaps with the next solve. At most maxsize snapshots wait to be
+    written; beyond that write() blocks, which caps the memory they use.
+
+    PyOP2 is not thread safe, so write() interpolates the fields into
+    discontinuous P1 and copies the values into numpy arrays on the calling
+    thread; that part of the output cost is not overlapped. The background
+    thread only writes the arrays as raw binary, which releases the GIL, and
+    adds a line to the .pvd. Triangle meshes only, and serial runs only as
+    the files are written by this process.
+
+    mode :: "w" starts a new collection, "a" adds to an existing one
+
+    flush() waits for every queued snapshot to be written, and close() also
+    stops the thread; a later write() starts it again. An error in the
+    writer thread is raised by the next write(), flush() or close(). Used as
+    a context manager the writer is closed on exit.
+    """
+
+    def __init__(self, filename, maxsize=2, mode="w"):
+        if not filename.endswith(".pvd"):
+            raise ValueError("The output file %s is not a .pvd file" % filename)
+        self.filename = filename
+        self.basename = os.path.splitext(filename)[0]
+        self.maxsize = maxsize
+        if os.path.dirname(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self.count = len(pvd_datasets(filename)) if mode == "a" else 0
+        if self.count == 0:
+            with open(filename, "wb") as f:
+                f.write(pvd_header + pvd_footer)
+        self.mesh = None
+        self.outputs = {}
+        self.error = None
+        self.thread = None
+        self.start()
+
+    def start(self):
+        self.queue = queue.Queue(self.maxsize)
+        self.thread = threading.Thread(target=self.worker, daemon=True)
+        self.thread.start()
+
+    def worker(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            try:
+                self.write_files(*item)
+            except Exception as error:
+                self.error = error
+            finally:
+                self.queue.task_done()
+
+    def topology(self, mesh):
+        """
+        Points and cells of the discontinuous P1 output mesh.
+        """
+        if mesh.ufl_cell() != triangle:
+            raise ValueError("Only triangle meshes can be written")
+        space = VectorFunctionSpace(mesh, "DG", 1)
+        points = Function(space).interpolate(SpatialCoordinate(mesh))
+        cells = space.cell_node_map().values
+        self.points = pad(points.dat.data_ro, (3,))
+        self.cells = [
+            ("connectivity", cells.astype(np.int32).ravel()),
+            ("offsets", 3 * np.arange(1, len(cells) + 1, dtype=np.int32)),
+            ("types", np.full(len(cells), 5, dtype=np.uint8)),
+        ]
+        self.mesh = mesh
+
+    def output(self, field):
+        """
+        Discontinuous P1 function the field is interpolated into.
+        """
+        space = field.function_space()
+        if space not in self.outputs:
+            shape = field.ufl_shape
+            if len(shape) == 0:
+                output = FunctionSpace(self.mesh, "DG", 1)
+            elif len(shape) == 1:
+                output = VectorFunctionSpace(self.mesh, "DG", 1, dim=shape[0])
+            else:
+                output = TensorFunctionSpace(self.mesh, "DG", 1, shape=shape)
+            self.outputs[space] = Function(output)
+        return self.outputs[space]
+
+    def snapshot(self, fields):
+        """
+        The values of the fields at the nodes of the output mesh, as numpy
+        arrays with the VTK number of components.
+        """
+        mesh = fields[0].function_space().mesh()
+        if mesh is not self.mesh:
+            self.outputs = {}
+            self.topology(mesh)
+        snapshot = []
+        for field in fields:
+            output = self.output(field)
+            output.interpolate(field)
+            shape = field.ufl_shape
+            if len(shape) == 1:
+                shape = (3,)
+            elif len(shape) == 2:
+                shape = (3, 3)
+            values = pad(output.dat.data_ro, shape)
+            snapshot.append((field.name(), values.reshape(len(values), -1)))
+        return snapshot
+
+    def write_files(self, snapshot, t):
+        vtu = "{}_{}.vtu".format(self.basename, self.count)
+        write_vtu(vtu, self.points, self.cells, snapshot)
+        self.count += 1
+
+        # the .vtu files sit next to the .pvd file, and the new dataset goes
+        # in front of the closing tags, so the .pvd is never rewritten
+        dataset = '<DataSet timestep="{!r}" file="{}"/>\n'.format(
+            float(t), os.path.basename(vtu)
+        )
+        with open(self.filename, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 256))
+            tail = f.read()
+            f.seek(size - len(tail) + tail.rindex(b"</Collection>"))
+            f.write(dataset.encode() + pvd_footer)
+            f.truncate()
+
+    def check(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise RuntimeError("Writing the output failed") from error
+
+    def write(self, *fields, time):
+        self.check()
+        if not self.thread.is_alive():
+            self.start()
+        self.queue.put((self.snapshot(fields), time))
+
+    def flush(self):
+        self.queue.join()
+        self.check()
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        self.check()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+byte_order = "LittleEndian" if sys.byteorder == "little" else "BigEndian"
+
+pvd_header = b'''<?xml version="1.0"?>
+<VTKFile type="Collection" version="0.1">
+<Collection>
+'''
+pvd_footer = b"</Collection>\n</VTKFile>\n"
+
+vtk_types = {
+    np.dtype(np.float64): "Float64",
+    np.dtype(np.int32): "Int32",
+    np.dtype(np.uint8): "UInt8",
+}
+
+
+def pad(values, shape):
+    """
+    Zero pads the trailing dimensions of values to shape, VTK vectors and
+    tensors being three dimensional.
+    """
+    values = np.asarray(values)
+    padded = np.zeros((len(values),) + shape, dtype=values.dtype)
+    padded[(slice(None),) + tuple(slice(0, n) for n in values.shape[1:])] = values
+    return padded
+
+
+def write_vtu(filename, points, cells, point_data):
+    """
+    Writes an unstructured grid with the arrays in raw binary appended data,
+    each preceded by its UInt32 byte count.
+
+    points :: coordinates, shape (points, 3)
+    cells :: (name, array) of the connectivity, offsets and types
+    point_data :: (name, array) of the fields, shape (points, components)
+    """
+    offset = 0
+    descriptors = []
+    arrays = [("Points", points)] + list(cells) + list(point_data)
+    for name, values in arrays:
+        components = values.shape[1] if values.ndim > 1 else 1
+        descriptors.append(
+            '<DataArray type="{}" Name="{}" NumberOfComponents="{}" '
+            'format="appended" offset="{}"/>\n'.format(
+                vtk_types[values.dtype], name, components, offset
+            )
+        )
+        offset += 4 + values.nbytes
+    header = (
+        '<?xml version="1.0"?>\n'
+        '<VTKFile type="UnstructuredGrid" version="0.1" byte_order="{}" '
+        'header_type="UInt32">\n'
+        "<UnstructuredGrid>\n"
+        '<Piece NumberOfPoints="{}" NumberOfCells="{}">\n'
+        "<Points>\n{}</Points>\n"
+        "<Cells>\n{}</Cells>\n"
+        "<PointData>\n{}</PointData>\n"
+        "</Piece>\n"
+        "</UnstructuredGrid>\n"
+        '<AppendedData encoding="raw">\n_'
+    ).format(
+        byte_order,
+        len(points),
+        len(cells[2][1]),
+        descriptors[0],
+        "".join(descriptors[1:4]),
+        "".join(descriptors[4:]),
+    )
+    with open(filename, "wb") as f:
+        f.write(header.encode())
+        for name, values in arrays:
+            f.write(np.uint32(values.nbytes).tobytes())
+            # numpy buffers are written without a copy, outside the GIL
+            f.write(np.ascontiguousarray(values))
+        f.write(b"\n</AppendedData>\n</VTKFile>\n")
+
+
+class OutputSchedule(object):
+    """
+    Decides which calls of SeaIceModel.dump write output. A call writes if
+    any of these applies:
+
+    dumpfreq :: every dumpfreq calls
+    dumpinterval :: the first call at or after each multiple of dumpinterval
+        model seconds
+    dumplist :: the first call at or after each of these model times
+    triggers :: a trigger(model, t) returns True, e.g. VelocityThreshold
+
+    With a fixed timestep dumpfreq is the step count. With an adaptive
+    timestep, use dumpinterval or dumplist; run() then shortens the step
+    before each output time so the output is written exactly at that time.
+    """
+
+    def __init__(
+        self, dumpfreq=None, dumpinterval=None, dumplist=None, triggers=None, t=0
+    ):
+        self.dumpfreq = dumpfreq
+        self.dumpinterval = dumpinterval
+        self.dumplist = sorted(dumplist or [])
+        self.triggers = list(triggers or [])
+        self.count = 0
+        self.reset(t)
+
+    def reset(self, t):
+        """
+        Skips the output times up to t, e.g. when restarting from t.
+        """
+        self.next_interval = inf
+        if self.dumpinterval:
+            self.next_interval = self.dumpinterval * (
+                floor(t / self.dumpinterval + self.tolerance(t)) + 1
+            )
+        self.next_listed = 0
+        while (
+            self.next_listed < len(self.dumplist)
+            and self.dumplist[self.next_listed] <= t + self.tolerance(t)
+        ):
+            self.next_listed += 1
+
+    def tolerance(self, t):
+        return 1e-10 * (1 + abs(t))
+
+    def next_time(self):
+        """
+        The next output time set by dumpinterval or dumplist, or inf.
+        """
+        listed = inf
+        if self.next_listed < len(self.dumplist):
+            listed = self.dumplist[self.next_listed]
+        return min(self.next_interval, listed)
+
+    def due(self, model, t):
+        self.count += 1
+        due = bool(self.dumpfreq) and self.count % self.dumpfreq == 0
+        if t >= self.next_time() - self.tolerance(t):
+            due = True
+            self.reset(t)
+        # every trigger is evaluated, so that their state stays current
+        fired = [trigger(model, t) for trigger in self.triggers]
+        return due or any(fired)
+
+
+class VelocityThreshold(object):
+    """
+    Output trigger that fires on the step at which the largest nodal speed
+    of model.u1 goes above threshold, and again each time it goes back
+    above after dropping below.
+    """
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.above = False
+
+    def __call__(self, model, t):
+        data = model.u1.dat.data_ro
+        local = np.max(np.linalg.norm(data, axis=-1)) if data.size else 0.0
+        speed = model.mesh.comm.allreduce(local, op=MPI.MAX)
+        fired = speed > self.threshold and not self.above
+        self.above = speed > self.threshold
+        return fired
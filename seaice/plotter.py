@@ -1,7 +1,3 @@
-from netCDF4 import Dataset
-import numpy as np
-import matplotlib.pyplot as plt
-
 __all__ = ["Plotter"]
 
 
@@ -15,8 +11,12 @@ class Plotter(object):
         self.timestep = timestepping.timestep
         self.timescale = timestepping.timescale
 
+        from netCDF4 import Dataset
+
         dataset = Dataset(dataset_dirname, mode="r")
         self.yaxis = dataset.variables[diagnostic][:]
+        # the recorded times, which are uneven when the timestep adapts
+        self.xaxis = dataset.variables["time"][:]
         dataset.close()
 
     def plot(self, plot_option="plot"):
@@ -24,8 +24,10 @@ class Plotter(object):
         """
         plot :: choose what plot you want to make
         """
+        # matplotlib is only needed here, so importing seaice does not load it
+        import matplotlib.pyplot as plt
 
-        t = np.arange(0, self.timescale, self.timestep)
+        t = self.xaxis
         if plot_option == "plot":
             plt.plot(t, self.yaxis, label="timescale = {}".format(self.timescale))
         elif plot_option == "loglog":
@@ -0,0 +1,122 @@
+import json
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from firedrake.petsc import PETSc
+
+__all__ = ["Profiler"]
+
+# PETSc events reported for every phase
+events = [
+    "SNESSolve",
+    "SNESFunctionEval",
+    "SNESJacobianEval",
+    "KSPSolve",
+    "PCSetUp",
+    "PCApply",
+    "MatLUFactorSym",
+    "MatLUFactorNum",
+]
+
+_disabled = nullcontext()
+
+
+class Profiler(object):
+    """
+    Times nested phases of a run, e.g. run;solve;momentum,
+    with a Python timer and, if petsc is set, a PETSc log stage per phase so
+    that the PETSc events (assembly, factorisation, ...) are split by phase.
+
+    A disabled profiler hands out a shared no-op context manager, so the
+    hooks in SeaIceModel cost next to nothing.
+
+    The profile is written with write() as JSON, or in the folded stack
+    format read by flamegraph.pl and speedscope if the filename ends in
+    .folded.
+    """
+
+    def __init__(self, enabled=True, petsc=True):
+        self.enabled = enabled
+        self.petsc = enabled and petsc
+        self.stack = []
+        self.timings = {}
+        self.stages = {}
+        if self.petsc:
+            PETSc.Log.begin()
+
+    def phase(self, name):
+        if not self.enabled:
+            return _disabled
+        return self._phase(name)
+
+    @contextmanager
+    def _phase(self, name):
+        self.stack.append(name)
+        path = ";".join(self.stack)
+        if self.petsc:
+            if path not in self.stages:
+                self.stages[path] = PETSc.Log.Stage(path)
+            self.stages[path].push()
+        begin = perf_counter()
+        try:
+            yield
+        finally:
+            seconds = perf_counter() - begin
+            if self.petsc:
+                self.stages[path].pop()
+            record = self.timings.setdefault(path, [0, 0.0])
+            record[0] += 1
+            record[1] += seconds
+            self.stack.pop()
+
+    def children(self, path):
+        depth = path.count(";") + 1
+        return [
+            child
+            for child in self.timings
+            if child.startswith(path + ";") and child.count(";") == depth
+        ]
+
+    def petsc_events(self, path):
+        info = {}
+        for name in events:
+            perf = PETSc.Log.Event(name).getPerfInfo(self.stages[path])
+            if perf["count"] > 0:
+                info[name] = {
+                    "count": perf["count"],
+                    "seconds": perf["time"],
+                    "flops": perf["flops"],
+                }
+        return info
+
+    def summary(self):
+        """
+        Calls, total and self (exclusive of nested phases) seconds of every
+        phase, with the PETSc events logged in it.
+        """
+        summary = {}
+        for path, (calls, seconds) in self.timings.items():
+            nested = sum(self.timings[child][1] for child in self.children(path))
+            summary[path] = {
+                "calls": calls,
+                "seconds": seconds,
+                "self_seconds": seconds - nested,
+            }
+            if self.petsc:
+                summary[path]["petsc"] = self.petsc_events(path)
+        return summary
+
+    def folded(self):
+        """
+        One "phase;nested_phase microseconds" line per phase, by self time.
+        """
+        return "\n".join(
+            "{} {}".format(path, int(round(1e6 * phase["self_seconds"])))
+            for path, phase in self.summary().items()
+        )
+
+    def write(self, filename):
+        with open(filename, "w") as f:
+            if filename.endswith(".folded"):
+                f.write(self.folded() + "\n")
+            else:
+                json.dump(self.summary(), f, indent=2)
@@ -0,0 +1,317 @@
+from math import ceil
+from time import perf_counter
+import numpy as np
+from firedrake import Function, Interpolator, LinearSolver, assemble
+from firedrake.petsc import PETSc
+from pyop2.mpi import MPI
+from firedrake.exceptions import ConvergenceError
+from ufl.algorithms import extract_coefficients
+
+__all__ = [
+    "PointwiseSolver",
+    "LinearUpdateSolver",
+    "SubcycledSolver",
+    "LaggedSolver",
+    "PicardNewtonSolver",
+    "SSPRK3Solver",
+    "MonitoredSolver",
+]
+
+
+class PointwiseSolver(object):
+    """
+    Evaluates an explicit expression into a function with an interpolation
+    kernel that is built once. Has the same solve() interface as a
+    NonlinearVariationalSolver, so it can be passed to SeaIceModel.solve.
+    """
+
+    def __init__(self, expr, func):
+        self.expr = expr
+        self.func = func
+        # the update may depend on the function it overwrites
+        if func in extract_coefficients(expr):
+            self.target = Function(func.function_space())
+        else:
+            self.target = func
+        self.interpolator = Interpolator(expr, self.target)
+
+    def solve(self):
+        self.interpolator.interpolate()
+        if self.target is not self.func:
+            self.func.assign(self.target)
+
+
+class LinearUpdateSolver(object):
+    """
+    Solves a(func, v) = L(v) where the operator a is assembled and factorised
+    once and only the right hand side L is reassembled on each solve.
+    """
+
+    def __init__(self, a, L, func, bcs=None, solver_parameters=None):
+        self.L = L
+        self.func = func
+        self.A = assemble(a, bcs=bcs)
+        self.b = assemble(L)
+        self.solver = LinearSolver(self.A, solver_parameters=solver_parameters)
+
+    def solve(self):
+        assemble(self.L, tensor=self.b)
+        self.solver.solve(self.func, self.b)
+
+
+class SSPRK3Solver(object):
+    """
+    Advances func from start over one timestep with the three stage SSP
+    Runge-Kutta scheme. The timestep is split into as many substeps as the
+    CFL condition
+
+        dt * max|velocity| <= cfl * hmin
+
+    needs, estimated from the velocity at the start of each solve.
+
+    increment :: LinearUpdateSolver for M dq = dt L(func), the explicit
+        update of func over a substep of length dt
+    dt :: Constant holding the substep length used by increment
+    """
+
+    def __init__(self, increment, start, func, velocity, dt, timestep, hmin, cfl):
+        self.increment = increment
+        self.dq = increment.func
+        self.start = start
+        self.func = func
+        self.velocity = velocity
+        self.dt = dt
+        self.timestep = timestep
+        self.hmin = hmin
+        self.cfl = cfl
+        self.comm = func.function_space().mesh().comm
+        self.q0 = Function(func.function_space())
+        self.substeps = []
+
+    def speed(self):
+        data = self.velocity.dat.data_ro
+        local = np.max(np.linalg.norm(data, axis=-1)) if data.size else 0.0
+        return self.comm.allreduce(local, op=MPI.MAX)
+
+    def number_of_substeps(self):
+        timestep = float(self.timestep)
+        return max(1, ceil(timestep * self.speed() / (self.cfl * self.hmin)))
+
+    def stage(self):
+        self.increment.solve()
+        self.func.assign(self.func + self.dq)
+
+    def solve(self):
+        substeps = self.number_of_substeps()
+        self.substeps.append(substeps)
+        self.dt.assign(float(self.timestep) / substeps)
+
+        self.func.assign(self.start)
+        for _ in range(substeps):
+            self.q0.assign(self.func)
+            self.stage()
+            self.stage()
+            self.func.assign(0.75 * self.q0 + 0.25 * self.func)
+            self.stage()
+            self.func.assign(self.q0 / 3 + 2 * self.func / 3)
+
+
+class SubcycledSolver(object):
+    """
+    Calls each of the solvers in turn, subcycles times per solve.
+    """
+
+    def __init__(self, subcycles, *solvers):
+        self.subcycles = subcycles
+        self.solvers = solvers
+
+    def solve(self):
+        for _ in range(self.subcycles):
+            for solver in self.solvers:
+                solver.solve()
+
+
+class LaggedSolver(object):
+    """
+    Wraps a NonlinearVariationalSolver so that the Jacobian and its
+    factorisation are reused across solves. They are rebuilt once every
+    steps solves, after a solve that needed more than max_its Newton
+    iterations, and whenever a solve with the old Jacobian fails. The retry
+    starts from the same initial guess func held before the failed solve.
+    """
+
+    def __init__(self, solver, func, steps, max_its):
+        self.solver = solver
+        self.snes = solver.snes
+        self.func = func
+        self.guess = Function(func.function_space())
+        self.steps = steps
+        self.max_its = max_its
+        self.age = None
+        self.rebuilds = 0
+        self.jacobians = 0
+        self.saved = 0
+
+    def lag(self, value):
+        self.snes.setLagJacobian(value)
+        self.snes.setLagPreconditioner(value)
+
+    def rebuild(self):
+        self.lag(1)
+        self.solver.solve()
+        self.age = 0
+        self.rebuilds += 1
+        self.jacobians += self.snes.getIterationNumber()
+
+    def solve(self):
+        if self.age is None or self.age >= self.steps:
+            self.rebuild()
+            return
+
+        self.guess.assign(self.func)
+        self.lag(-1)
+        try:
+            self.solver.solve()
+        except ConvergenceError:
+            self.func.assign(self.guess)
+            self.rebuild()
+            return
+
+        its = self.snes.getIterationNumber()
+        self.saved += its
+        self.age += 1
+        if its > self.max_its:
+            self.age = self.steps
+
+    def statistics(self):
+        """
+        jacobians :: Jacobian assemblies and factorisations performed
+        saved :: Newton iterations that reused an old factorisation
+        """
+        return {
+            "rebuilds": self.rebuilds,
+            "jacobians": self.jacobians,
+            "saved": self.saved,
+        }
+
+
+class PicardNewtonSolver(object):
+    """
+    Runs the Picard solver until it stops (converged or out of iterations)
+    and then finishes the solve with Newton. Both solvers share the same
+    unknown. Any other Picard failure (a failed line search or linear solve,
+    a NaN residual) is raised, as Newton would start from a bad iterate.
+    Iteration counts and wall times are kept for every solve.
+    """
+
+    def __init__(self, picard, newton):
+        self.picard = picard
+        self.newton = newton
+        self.snes = newton.snes
+        self.picard_its = []
+        self.newton_its = []
+        self.linear_its = []
+        self.picard_times = []
+        self.newton_times = []
+
+    def solve(self):
+        start = perf_counter()
+        try:
+            self.picard.solve()
+        except ConvergenceError:
+            # running out of Picard iterations just hands over to Newton early
+            reason = self.picard.snes.getConvergedReason()
+            if reason != PETSc.SNES.ConvergedReason.DIVERGED_MAX_IT:
+                raise
+        split = perf_counter()
+        self.newton.solve()
+        end = perf_counter()
+
+        self.picard_its.append(self.picard.snes.getIterationNumber())
+        self.newton_its.append(self.snes.getIterationNumber())
+        self.linear_its.append(
+            self.picard.snes.getLinearSolveIterations()
+            + self.snes.getLinearSolveIterations()
+        )
+        self.picard_times.append(split - start)
+        self.newton_times.append(end - split)
+
+    def statistics(self):
+        return {
+            "picard_its": sum(self.picard_its),
+            "newton_its": sum(self.newton_its),
+            "linear_its": sum(self.linear_its),
+            "picard_time": sum(self.picard_times),
+            "newton_time": sum(self.newton_times),
+        }
+
+
+class MonitoredSolver(object):
+    """
+    Records the Newton iterations, Krylov iterations, Newton residual norms,
+    converged reason and wall time of every solve of the wrapped solver,
+    through a SNES monitor instead of printing to stdout. Any other
+    attribute is looked up on the wrapped solver.
+    """
+
+    def __init__(self, solver, verbose=False):
+        self.solver = solver
+        self.snes = solver.snes
+        self.verbose = verbose
+        self.newton_its = []
+        self.linear_its = []
+        self.residuals = []
+        self.reasons = []
+        self.seconds = []
+        self.current = []
+        self.snes.setMonitor(self.monitor)
+
+    def __getattr__(self, name):
+        if name == "solver":
+            raise AttributeError(name)
+        return getattr(self.solver, name)
+
+    def monitor(self, snes, its, fnorm):
+        self.current.append(fnorm)
+
+    def solve(self):
+        self.current = []
+        begin = perf_counter()
+        try:
+            self.solver.solve()
+        finally:
+            self.seconds.append(perf_counter() - begin)
+            self.residuals.append(np.array(self.current))
+            self.newton_its.append(self.snes.getIterationNumber())
+            self.linear_its.append(self.snes.getLinearSolveIterations())
+            self.reasons.append(self.snes.getConvergedReason())
+            if self.verbose:
+                print(
+                    "newton its {:3d} linear its {:5d} residual {:.3e} "
+                    "reason {:2d} {:.3f} s".format(**self.last())
+                )
+
+    def last(self):
+        """
+        The record of the latest solve.
+        """
+        residuals = self.residuals[-1]
+        return {
+            "newton_its": self.newton_its[-1],
+            "linear_its": self.linear_its[-1],
+            "residual": residuals[-1] if residuals.size else np.nan,
+            "reason": self.reasons[-1],
+            "seconds": self.seconds[-1],
+        }
+
+    def telemetry(self):
+        """
+        Totals over every solve so far.
+        """
+        return {
+            "solves": len(self.seconds),
+            "newton_its": sum(self.newton_its),
+            "linear_its": sum(self.linear_its),
+            "failed": sum(1 for reason in self.reasons if reason < 0),
+            "seconds": sum(self.seconds),
+        }
@@ -0,0 +1,159 @@
+import numpy as np
+from firedrake import Constant, Function, assemble, inner, dx
+from firedrake.exceptions import ConvergenceError
+
+__all__ = ["AdaptiveTimestepController"]
+
+
+class AdaptiveTimestepController(object):
+    """
+    Chooses the timestep of a SeaIceModel after every step and rejects steps
+    that are too inaccurate, through model.set_timestep so that none of the
+    forms are rebuilt.
+
+    method :: "error" compares the theta scheme solution with the explicit
+        extrapolation of the two previous time levels, an estimate of the
+        local error of the extrapolation, which scales with timestep^2, and
+        aims for a relative error of tol.
+        "iterations" aims for target_its Newton iterations per step.
+    tol :: relative error per step ("error")
+    target_its :: Newton iterations per step ("iterations")
+    min_timestep, max_timestep :: bounds of the timestep, default to 1/100
+        and 100 times the initial timestep
+    grow, shrink :: bounds of the factor the timestep changes by in one step
+    safety :: factor applied to the optimal timestep
+    """
+
+    def __init__(
+        self,
+        model,
+        method="error",
+        tol=1e-3,
+        target_its=4,
+        min_timestep=None,
+        max_timestep=None,
+        grow=2,
+        shrink=0.25,
+        safety=0.9,
+    ):
+        if method not in ("error", "iterations"):
+            raise ValueError("Unknown method %s, use 'error' or 'iterations'" % method)
+        self.model = model
+        self.method = method
+        self.tol = tol
+        self.target_its = target_its
+        dt = float(model.timestep)
+        self.min_timestep = dt / 100 if min_timestep is None else min_timestep
+        self.max_timestep = dt * 100 if max_timestep is None else max_timestep
+        self.grow = grow
+        self.shrink = shrink
+        self.safety = safety
+
+        if method == "iterations":
+            snes = [s.snes for s in model.solvers if hasattr(s, "snes")]
+            if not snes:
+                raise ValueError("The model has no Newton solver to count")
+            self.snes = snes[0]
+
+        self.ratio = Constant(1)
+        self.levels = []
+        for old, new in model.time_levels:
+            previous = Function(old.function_space())
+            prediction = Function(new.function_space())
+            error = inner(new - prediction, new - prediction) * dx
+            size = inner(new, new) * dx
+            self.levels.append((old, new, previous, prediction, error, size))
+        self.previous_timestep = None
+
+        self.accepted = []
+        self.rejected = []
+
+    def begin(self, t, end):
+        """
+        Called before a step from t: stops the step overshooting end (the
+        end of the run or the next output time) and computes the predictor
+        for the error estimate. A step that would stop less than
+        min_timestep short of end is stretched to end instead.
+        """
+        self.timestep = float(self.model.timestep)
+        # the timestep chosen before clipping, which the next step goes back to
+        self.unclipped = None
+        if t + self.timestep > end - self.min_timestep:
+            self.unclipped = self.timestep
+            self.timestep = end - t
+            self.model.set_timestep(self.timestep)
+        if self.method == "error" and self.previous_timestep is not None:
+            self.ratio.assign(self.timestep / self.previous_timestep)
+            for old, new, previous, prediction, error, size in self.levels:
+                prediction.assign(old + self.ratio * (old - previous))
+
+    def estimate(self):
+        """
+        Largest relative difference between the new time levels and the
+        predictor.
+        """
+        estimate = 0
+        for old, new, previous, prediction, error, size in self.levels:
+            scale = max(np.sqrt(assemble(size)), 1e-12)
+            estimate = max(estimate, np.sqrt(assemble(error)) / scale)
+        return estimate
+
+    def factor(self):
+        if self.method == "iterations":
+            its = max(self.snes.getIterationNumber(), 1)
+            return self.target_its / its, its <= 2 * self.target_its
+        if self.previous_timestep is None:
+            # no history for the predictor yet
+            return 1, True
+        estimate = max(self.estimate(), 1e-12)
+        # the error of the linear predictor, O(timestep^2), dominates the
+        # estimate whatever the order of the scheme
+        factor = self.safety * (self.tol / estimate) ** 0.5
+        return factor, estimate <= self.tol
+
+    def accept(self, converged=True):
+        """
+        Called after the solve. Returns whether the step is kept, and sets
+        model.timestep for the next (or the repeated) step.
+        """
+        at_min = self.timestep <= self.min_timestep
+        if converged:
+            factor, accepted = self.factor()
+            # nothing is gained by repeating a step at the minimum timestep
+            accepted = accepted or at_min
+        elif at_min:
+            raise ConvergenceError("Nonlinear solve failed at the minimum timestep")
+        else:
+            factor, accepted = self.shrink, False
+        factor = min(self.grow, max(self.shrink, factor))
+        timestep = factor * self.timestep
+        timestep = min(self.max_timestep, max(self.min_timestep, timestep))
+
+        if accepted:
+            self.accepted.append(self.timestep)
+            if self.unclipped is not None and self.previous_timestep is not None:
+                # a clipped step can be very short, so the predictor keeps
+                # extrapolating from the level before it
+                self.previous_timestep += self.timestep
+            else:
+                for old, new, previous, prediction, error, size in self.levels:
+                    previous.assign(old)
+                self.previous_timestep = self.timestep
+            if self.unclipped is not None:
+                # the factor of a clipped step says little about the next one
+                timestep = self.unclipped
+        else:
+            self.rejected.append(self.timestep)
+            for old, new, previous, prediction, error, size in self.levels:
+                new.assign(old)
+        self.model.set_timestep(timestep)
+        return accepted
+
+    def statistics(self):
+        return {
+            "accepted": len(self.accepted),
+            "rejected": len(self.rejected),
+            "min_timestep": min(self.accepted) if self.accepted else None,
+            "max_timestep": max(self.accepted) if self.accepted else None,
+            "mean_timestep": np.mean(self.accepted) if self.accepted else None,
+        }
@@ -0,0 +1,253 @@
+"""
+Fills the persistent form compilation cache, so that the first solve of a
+production job or test run does not pay for code generation and the C
+compiler.
+
+usage : python -m seaice.warmup [--models vp evp ...] [--families CR CG]
+                                [--theta 0.5 ...] [--no-periodic]
+
+Every model is built and solved for one step on a small mesh for each
+family, stabilisation and mesh type (periodic and not, which have different
+coordinate elements), with each variant of the model (stress update,
+transport mode). The kernels land in the PyOP2 and TSFC disk caches, which
+live under $PYOP2_CACHE_DIR and $FIREDRAKE_TSFC_KERNEL_CACHE_DIR.
+
+The kernels are cached by form, so a job only finds them in the cache if it
+builds the same forms: the same forcing expressions, initial conditions
+and solver parameters. By default the forms are those of the box test
+(box_conditions) with the test solver preset, which other jobs compile
+again. A job can warm its own forms by passing its conditions and
+solver_params factories to warmup().
+
+theta is a Constant in the forms, so one value compiles the kernels for all
+of them.
+"""
+import sys
+import argparse
+import itertools
+import tempfile
+from time import perf_counter
+from firedrake import (
+    PeriodicSquareMesh,
+    SquareMesh,
+    SpatialCoordinate,
+    as_vector,
+    as_matrix,
+)
+from firedrake.exceptions import ConvergenceError
+from seaice.config import (
+    Conditions,
+    TimesteppingParameters,
+    OutputParameters,
+    SolverParameters,
+    SeaIceParameters,
+)
+from seaice.models import (
+    ViscousPlastic,
+    ViscousPlasticTransport,
+    ElasticViscousPlastic,
+    ElasticViscousPlasticStress,
+    ElasticViscousPlasticTransport,
+    ModifiedElasticViscousPlastic,
+)
+
+__all__ = ["warmup", "build_model", "box_conditions", "default_solver_params"]
+
+# model, and the (conditions, solver parameters) options of each variant
+model_variants = {
+    "vp": (ViscousPlastic, [({}, {})]),
+    "vpt": (ViscousPlasticTransport, [({}, {})]),
+    "evp": (ElasticViscousPlastic, [({}, {})]),
+    "evps": (
+        ElasticViscousPlasticStress,
+        [
+            ({}, {"stress_update": "solve"}),
+            ({}, {"stress_update": "project"}),
+            ({}, {"stress_update": "interpolate"}),
+        ],
+    ),
+    "evpt": (
+        ElasticViscousPlasticTransport,
+        [
+            ({"transport": "monolithic"}, {}),
+            ({"transport": "split"}, {}),
+            ({"transport": "explicit"}, {}),
+        ],
+    ),
+    "mevp": (ModifiedElasticViscousPlastic, [({}, {})]),
+}
+
+number_of_triangles = 4
+length = 5 * 10 ** 5
+
+
+def box_conditions(mesh, family, theta, stabilised, **options):
+    """
+    Box test conditions on a square mesh of side length: ocean current,
+    no wind, u = 0, h = 1 and a = x / length. What warmup compiles by
+    default.
+    """
+    x, y = SpatialCoordinate(mesh)
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_matrix([[0, 0], [0, 0]])}
+    return Conditions(
+        family=family,
+        ocean_curr=ocean_curr,
+        ic=ic,
+        theta=theta,
+        stabilised={"state": stabilised, "alpha": 1},
+        **options
+    )
+
+
+def default_solver_params(**options):
+    return SolverParameters(preset="test", **options)
+
+
+def build_model(
+    model,
+    mesh,
+    dirname,
+    family="CR",
+    theta=0.5,
+    stabilised=False,
+    variant=({}, {}),
+    timestepping=None,
+    output=None,
+    conditions=box_conditions,
+    solver_params=default_solver_params,
+):
+    """
+    Builds the model, ready to solve.
+
+    variant :: (conditions options, solver parameters options), see
+        model_variants
+    timestepping :: TimesteppingParameters options, one step of 1s if None
+    output :: OutputParameters options, no output if None
+    conditions :: conditions(mesh, family, theta, stabilised, **options)
+        returns the Conditions
+    solver_params :: solver_params(**options) returns the SolverParameters
+    """
+    conditions_options, solver_options = variant
+    timestepping = dict({"timescale": 1, "timestep": 1}, **(timestepping or {}))
+    solver = solver_params(**solver_options)
+
+    ice = model(
+        mesh=mesh,
+        conditions=conditions(mesh, family, theta, stabilised, **conditions_options),
+        timestepping=TimesteppingParameters(**timestepping),
+        output=OutputParameters(
+            dirname=dirname, **dict({"dumpfreq": 10 ** 6}, **(output or {}))
+        ),
+        params=SeaIceParameters(),
+        solver_params=solver,
+    )
+    if not hasattr(ice, "usolver"):
+        func = ice.w1 if hasattr(ice, "w1") else ice.u1
+        ice.assemble(ice.eqn, func, ice.bcs, solver.preset)
+    return ice
+
+
+def warmup_model(model, mesh, dirname, **options):
+    """
+    Builds the model (options as for build_model) and solves one step.
+    Returns the wall time.
+    """
+    begin = perf_counter()
+    ice = build_model(model, mesh, dirname, timestepping={"subcycles": 2}, **options)
+    try:
+        ice.solve(*ice.solvers)
+    except ConvergenceError:
+        # the kernels are compiled whether or not the step converges
+        pass
+    return perf_counter() - begin
+
+
+def warmup(
+    names=None,
+    families=("CR", "CG"),
+    thetas=(0.5,),
+    periodic=True,
+    verbose=True,
+    conditions=box_conditions,
+    solver_params=default_solver_params,
+):
+    """
+    Compiles every combination of model, variant, family, theta,
+    stabilisation and mesh type. Returns a list of (combination, seconds).
+
+    conditions, solver_params :: factories as for build_model, to compile
+        the forms of a job rather than those of the box test
+    """
+    if names is None:
+        names = list(model_variants)
+    meshes = [("square", SquareMesh(number_of_triangles, number_of_triangles, length))]
+    if periodic:
+        meshes.append(
+            (
+                "periodic",
+                PeriodicSquareMesh(number_of_triangles, number_of_triangles, length),
+            )
+        )
+
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp:
+        dirname = tmp + "/u.pvd"
+        for name in names:
+            model, variants = model_variants[name]
+            for options in itertools.product(
+                variants, families, thetas, (False, True), meshes
+            ):
+                variant, family, theta, stabilised, mesh = options
+                conditions_options, solver_options = variant
+                combination = (
+                    name,
+                    dict(conditions_options, **solver_options),
+                    family,
+                    theta,
+                    stabilised,
+                    mesh[0],
+                )
+                seconds = warmup_model(
+                    model,
+                    mesh[1],
+                    dirname,
+                    family=family,
+                    theta=theta,
+                    stabilised=stabilised,
+                    variant=variant,
+                    conditions=conditions,
+                    solver_params=solver_params,
+                )
+                timings.append((combination, seconds))
+                if verbose:
+                    print("{:8.2f}s".format(seconds), *combination)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m seaice.warmup",
+        description="Compile the kernels of every model into the disk cache.",
+    )
+    parser.add_argument("--models", nargs="+", choices=list(model_variants))
+    parser.add_argument("--families", nargs="+", default=["CR", "CG"])
+    parser.add_argument("--theta", nargs="+", type=float, default=[0.5])
+    parser.add_argument("--no-periodic", action="store_true")
+    args = parser.parse_args(argv)
+
+    begin = perf_counter()
+    timings = warmup(
+        args.models, args.families, args.theta, periodic=not args.no_periodic
+    )
+    print(
+        "Compiled {} combinations in {:.1f}s".format(
+            len(timings), perf_counter() - begin
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,99 @@
+import pytest
+from seaice import *
+from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector, Constant
+
+
+def model(method, timescale, **schedule):
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(family="CG", ocean_curr=ocean_curr, ic=ic)
+
+    adaptive = {"state": True, "method": method}
+    timestepping = TimesteppingParameters(
+        timescale=timescale, timestep=1, adaptive=adaptive
+    )
+    output = OutputParameters(dirname=dirname, **(schedule or {"dumpfreq": 10 ** 3}))
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    evp = ElasticViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+    evp.assemble(evp.eqn, evp.w1, evp.bcs, solver.srt_params)
+    return evp
+
+
+@pytest.mark.parametrize("method", ["error", "iterations"])
+def test_adaptive_timestep_run(method):
+    timescale = 100
+    evp = model(method, timescale)
+
+    times = []
+    t = evp.run(callbacks=[lambda model, t: times.append(t)])
+    stats = evp.controller.statistics()
+
+    assert t == pytest.approx(timescale)
+    assert stats["accepted"] == len(times)
+    assert stats["max_timestep"] > 1
+
+
+def test_adaptive_timestep_constant():
+    evp = model("error", 10)
+
+    assert isinstance(evp.timestep, Constant)
+    with pytest.raises(ValueError):
+        AdaptiveTimestepController(evp, method="cfl")
+
+
+def test_adaptive_timestep_output_times():
+    # the output times do not fall on multiples of the initial timestep
+    evp = model("error", 20, dumpinterval=2.5)
+    assert evp.output.dumpfreq is None
+
+    times = []
+    restored = []
+
+    def record(model, t):
+        times.append(t)
+        if model.controller.unclipped is not None:
+            restored.append(float(model.timestep) == model.controller.unclipped)
+
+    t = evp.run(callbacks=[record])
+
+    assert t == pytest.approx(20)
+    for output_time in [2.5 * n for n in range(1, 9)]:
+        assert min(abs(s - output_time) for s in times) < 1e-8
+    # after a step clipped to an output time the timestep is the one chosen
+    # before clipping, not one scaled down from the clipped step
+    assert restored and all(restored)
+
+
+def test_adaptive_timestep_last_step():
+    # a step restored after the output at 45 is more than twice the time
+    # left after the output at 90, which must not end the run early
+    evp = model("iterations", 100, dumpinterval=45)
+    # run() reuses the controller, here held at a timestep of 32
+    controller = evp.timestep_controller()
+    controller.max_timestep = controller.min_timestep = 32
+    evp.set_timestep(32)
+
+    t = evp.run()
+
+    assert t == pytest.approx(100)
+    assert controller.accepted[-1] == pytest.approx(10)
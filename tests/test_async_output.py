@@ -0,0 +1,106 @@
+import re
+import shutil
+import pytest
+import numpy as np
+from seaice import *
+from seaice.output import pvd_datasets
+from firedrake import (
+    PeriodicSquareMesh,
+    SpatialCoordinate,
+    FunctionSpace,
+    Function,
+    as_vector,
+)
+
+
+def point_data(filename, name):
+    with open(filename, "rb") as f:
+        header, _, data = f.read().partition(b'<AppendedData encoding="raw">\n_')
+    pattern = b'Name="' + name.encode() + b'"[^>]*offset="([0-9]+)"'
+    offset = int(re.search(pattern, header).group(1))
+    # a UInt32 byte count precedes the data
+    size = int(np.frombuffer(data[offset : offset + 4], dtype=np.uint32)[0])
+    return np.frombuffer(data[offset + 4 : offset + 4 + size])
+
+
+def test_async_writer_snapshots(tmp_path):
+    mesh = PeriodicSquareMesh(4, 4, 1)
+    f = Function(FunctionSpace(mesh, "DG", 0), name="f")
+    filename = str(tmp_path / "f.pvd")
+
+    with AsyncOutputWriter(filename, maxsize=1) as writer:
+        for t in range(5):
+            f.assign(t)
+            writer.write(f, time=t)
+    assert not writer.thread.is_alive()
+
+    written = pvd_datasets(filename)
+    assert [t for t, _ in written] == list(range(5))
+    # each file holds the field as it was when dumped, not as it is now
+    for t, vtu in written:
+        assert (point_data(str(tmp_path / vtu), "f") == t).all()
+
+
+def test_async_writer_append(tmp_path):
+    mesh = PeriodicSquareMesh(4, 4, 1)
+    f = Function(FunctionSpace(mesh, "CG", 1), name="f")
+    filename = str(tmp_path / "f.pvd")
+
+    with AsyncOutputWriter(filename) as writer:
+        writer.write(f, time=0)
+        writer.write(f, time=1)
+    with AsyncOutputWriter(filename, mode="a") as writer:
+        writer.write(f, time=2)
+
+    assert pvd_datasets(filename) == [(0, "f_0.vtu"), (1, "f_1.vtu"), (2, "f_2.vtu")]
+
+
+def test_async_writer_error(tmp_path):
+    mesh = PeriodicSquareMesh(4, 4, 1)
+    f = Function(FunctionSpace(mesh, "DG", 0))
+    writer = AsyncOutputWriter(str(tmp_path / "output" / "f.pvd"))
+    shutil.rmtree(str(tmp_path / "output"))
+
+    writer.write(f, time=0)
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    writer.close()
+
+
+def test_vp_model_dump_async():
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5}
+    conditions = Conditions(family="CR", ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=3, timestep=1)
+    output = OutputParameters(dirname=dirname, dumpfreq=1, dump_async=True)
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    vp = ViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+    vp.assemble(vp.eqn, vp.u1, vp.bcs, solver.test_params)
+    t = vp.run()
+
+    assert t == 3
+    assert isinstance(vp.outfile, AsyncOutputWriter)
+    # run() waits for the output and stops the writer thread
+    assert not vp.outfile.thread.is_alive()
+    assert len(pvd_datasets(dirname)) == 3
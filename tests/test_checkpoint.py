@@ -0,0 +1,130 @@
+import os
+import pytest
+from seaice import *
+from seaice.output import pvd_datasets
+from firedrake import (
+    PeriodicSquareMesh,
+    SpatialCoordinate,
+    as_vector,
+    errornorm,
+    norm,
+)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        ViscousPlasticTransport,
+        ElasticViscousPlasticTransport,
+        ModifiedElasticViscousPlastic,
+    ],
+)
+def test_checkpoint_restart(model):
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 4
+
+    dirname = "./output/test-output/u.pvd"
+    checkpoint_dirname = "./output/test-output/checkpoint"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(family="CG", ocean_curr=ocean_curr, ic=ic)
+
+    output = OutputParameters(
+        dirname=dirname, dumpfreq=dumpfreq, checkpoint_dirname=checkpoint_dirname
+    )
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    def build(timescale):
+        timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+        return model(
+            mesh=mesh,
+            conditions=conditions,
+            timestepping=timestepping,
+            output=output,
+            params=params,
+            solver_params=solver,
+        )
+
+    full = build(timescale)
+    full.run()
+
+    first_half = build(timescale / 2)
+    t = first_half.run()
+    first_half.checkpoint(t)
+
+    second_half = build(timescale)
+    t = second_half.restore()
+    assert t == timescale / 2
+    second_half.run(t)
+
+    fields = [
+        (levels[1], restored[1])
+        for levels, restored in zip(full.time_levels, second_half.time_levels)
+    ]
+    restored = second_half.checkpoint_fields()
+    fields += [(full.checkpoint_fields()[name], restored[name]) for name in restored]
+    for expected, result in fields:
+        assert errornorm(expected, result) <= 1e-12 * norm(expected)
+
+
+def test_restart_appends_output(tmp_path):
+    dirname = str(tmp_path / "u.pvd")
+    checkpoint_dirname = str(tmp_path / "checkpoint")
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1}
+    conditions = Conditions(family="CG", ocean_curr=ocean_curr, ic=ic)
+
+    def build(timescale, append):
+        output = OutputParameters(
+            dirname=dirname,
+            dumpfreq=1,
+            checkpoint_dirname=checkpoint_dirname,
+            append=append,
+        )
+        return ViscousPlasticTransport(
+            mesh=mesh,
+            conditions=conditions,
+            timestepping=TimesteppingParameters(timescale=timescale, timestep=1),
+            output=output,
+            params=SeaIceParameters(),
+            solver_params=SolverParameters(),
+        )
+
+    def read(vtu):
+        with open(os.path.join(str(tmp_path), vtu), "rb") as f:
+            return f.read()
+
+    first_half = build(2, False)
+    first_half.checkpoint(first_half.run())
+    before = {vtu: read(vtu) for t, vtu in pvd_datasets(dirname)}
+
+    second_half = build(4, True)
+    second_half.run(second_half.restore())
+    datasets = pvd_datasets(dirname)
+
+    assert [t for t, vtu in datasets] == [1, 2, 3, 4]
+    assert len(set(vtu for t, vtu in datasets)) == 4
+    # the snapshots written before the restart are untouched
+    assert all(read(vtu) == data for vtu, data in before.items())
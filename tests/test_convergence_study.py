@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+from seaice import *
+from firedrake import SpatialCoordinate, as_vector, norm
+
+length = 5 * 10 ** 5
+
+
+def second_order(values, comm):
+    return (np.sqrt(2) * length / values) ** 2
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_convergence_study(processes):
+    study = ConvergenceStudy(second_order, [5, 10, 20, 40, 80], length)
+    errors = study.run(processes=processes)
+
+    assert errors == [second_order(values, None) for values in [5, 10, 20, 40, 80]]
+    assert round(study.slope() - 2, 6) == 0
+
+
+def test_convergence_study_order():
+    study = ConvergenceStudy(second_order, [10, 80, 5, 40], length)
+
+    assert [study.number_of_triangles[i] for i in study.order()] == [80, 40, 10, 5]
+
+    with pytest.raises(RuntimeError):
+        study.slope()
+
+
+def test_hierarchy_initial_guess_saves_newton_iterations():
+    newton_its = []
+
+    def setup(mesh, callbacks, initial_guess):
+        x, y = SpatialCoordinate(mesh)
+        ocean_curr = as_vector(
+            [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+        )
+        ic = {"u": 0, "a": x / length, "h": 1}
+        conditions = Conditions(family="CG", ocean_curr=ocean_curr, ic=ic)
+        timestepping = TimesteppingParameters(timescale=40, timestep=10)
+        output = OutputParameters(
+            dirname="./output/test-output/u.pvd", dumpfreq=10 ** 3
+        )
+        solver = SolverParameters()
+        vp = ViscousPlastic(
+            mesh=mesh,
+            conditions=conditions,
+            timestepping=timestepping,
+            output=output,
+            params=SeaIceParameters(),
+            solver_params=solver,
+        )
+        vp.assemble(vp.eqn, vp.u1, vp.bcs, solver.srt_params)
+        vp.run(callbacks=callbacks, initial_guess=initial_guess)
+        newton_its.append(vp.usolver.telemetry()["newton_its"])
+        return norm(vp.u1)
+
+    study = HierarchyConvergenceStudy(setup, 5, 1, length)
+    study.run()
+    with_guess = newton_its[-1]
+
+    # the finest level again, starting every solve from the previous step
+    setup(study.hierarchy[-1], [], None)
+    without_guess = newton_its[-1]
+
+    assert with_guess < without_guess
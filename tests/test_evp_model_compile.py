@@ -1,6 +1,12 @@
 import pytest
 from seaice import *
-from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector
+from firedrake import (
+    PeriodicSquareMesh,
+    SpatialCoordinate,
+    Constant,
+    as_vector,
+    norm,
+)
 
 
 @pytest.mark.parametrize(
@@ -114,3 +120,102 @@ def test_evp_model_compile_order(state, theta, order):
         t += timestep
 
     assert t > 0
+
+
+@pytest.mark.parametrize("family", ["CR", "CG"])
+def test_evp_model_lag(family):
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 6
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 35
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(family=family, ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    params = SeaIceParameters()
+
+    models = []
+    for state in [False, True]:
+        solver = SolverParameters(lag={"state": state, "steps": 3, "max_its": 5})
+        evp = ElasticViscousPlastic(
+            mesh=mesh,
+            conditions=conditions,
+            timestepping=timestepping,
+            output=output,
+            params=params,
+            solver_params=solver,
+        )
+        evp.assemble(evp.eqn, evp.w1, evp.bcs, solver.test_params)
+        evp.run()
+        models.append(evp)
+
+    exact, lagged = models
+    statistics = lagged.usolver.statistics()
+
+    assert statistics["rebuilds"] < timescale
+    assert statistics["saved"] > 0
+    assert norm(exact.u1 - lagged.u1) < 1e-6 * norm(exact.u1)
+
+
+def test_evp_model_set_timestep():
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 2
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(family="CG", ocean_curr=ocean_curr, ic=ic, theta=1)
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    evp = ElasticViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+    evp.assemble(evp.eqn, evp.w1, evp.bcs, solver.test_params)
+
+    assert isinstance(evp.timestep, Constant)
+    assert isinstance(evp.theta, Constant)
+
+    usolver = evp.usolver
+    evp.run()
+    evp.set_timestep(10)
+    evp.theta.assign(0.5)
+    evp.ocean_scale.assign(0.5)
+    t = evp.run(t=2 - 10)
+
+    assert t == 2
+    assert float(evp.timestep) == 10
+    assert evp.usolver is usolver
+    assert norm(evp.u1) > 0
@@ -0,0 +1,96 @@
+import pytest
+from seaice import *
+from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector, errornorm, norm
+
+
+@pytest.mark.parametrize(
+    "family, theta, stress_update",
+    [
+        (a, b, c)
+        for a in ["CR", "CG"]
+        for b in [0, 0.5, 1]
+        for c in ["solve", "project", "interpolate"]
+    ],
+)
+def test_evp_stress_model_compile(family, theta, stress_update):
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 1
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 35
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5}
+    conditions = Conditions(family=family, ocean_curr=ocean_curr, ic=ic, theta=theta)
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters(stress_update=stress_update)
+    params = SeaIceParameters()
+
+    evps = ElasticViscousPlasticStress(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+
+    t = evps.run()
+
+    assert t > 0
+
+
+def test_evp_stress_model_stress_update():
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 3
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 35
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5}
+    conditions = Conditions(family="CR", ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    params = SeaIceParameters()
+
+    models = {}
+    for stress_update in ["solve", "project", "interpolate"]:
+        evps = ElasticViscousPlasticStress(
+            mesh=mesh,
+            conditions=conditions,
+            timestepping=timestepping,
+            output=output,
+            params=params,
+            solver_params=SolverParameters(stress_update=stress_update),
+        )
+        evps.run()
+        models[stress_update] = evps
+
+    exact = models["solve"].sigma1
+    scale = norm(exact)
+    # the same projection
+    assert errornorm(exact, models["project"].sigma1) < 1e-8 * scale
+    # a different discretisation of the same stress
+    assert errornorm(exact, models["interpolate"].sigma1) < 1e-1 * scale
@@ -1,6 +1,15 @@
 import pytest
 from seaice import *
-from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector, pi
+from firedrake import (
+    PeriodicSquareMesh,
+    SpatialCoordinate,
+    as_vector,
+    pi,
+    assemble,
+    dx,
+    errornorm,
+    norm,
+)
 
 # this one takes a while to run - could take out some of these options?
 
@@ -61,3 +70,242 @@ def test_evp_transport_model_compile(family, theta):
         t += timestep
 
     assert t > 0
+
+
+@pytest.mark.parametrize("family", ["CR", "CG"])
+def test_evp_transport_model_run(family):
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 2
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(family=family, ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    evp_transport = ElasticViscousPlasticTransport(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+
+    times = []
+    t = evp_transport.run(callbacks=[lambda model, t: times.append(t)])
+
+    assert t == timescale
+    assert times == [1, 2]
+    assert evp_transport.timings["solve"] > 0
+
+
+@pytest.mark.parametrize(
+    "preset, transport",
+    [
+        ("evpt_bjacobi", "monolithic"),
+        ("evpt_schur", "monolithic"),
+        # static condensation needs the velocity-stress system of W1
+        ("evp_sc", "split"),
+    ],
+)
+def test_evp_transport_model_fieldsplit(preset, transport):
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 1
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 35
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(
+        family="CG", ocean_curr=ocean_curr, ic=ic, transport=transport
+    )
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters(preset=preset)
+    params = SeaIceParameters()
+
+    evp_transport = ElasticViscousPlasticTransport(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+
+    t = evp_transport.run()
+
+    assert t > 0
+    assert evp_transport.usolver.snes.getConvergedReason() > 0
+
+
+@pytest.mark.parametrize(
+    "family, transport",
+    [(a, b) for a in ["CR", "CG"] for b in ["split", "explicit"]],
+)
+def test_evp_transport_model_split(family, transport):
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 2
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(
+        family=family, ocean_curr=ocean_curr, ic=ic, transport=transport
+    )
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    evp_transport = ElasticViscousPlasticTransport(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+
+    mass = assemble(evp_transport.h0 * dx)
+    t = evp_transport.run()
+
+    assert t == timescale
+    assert len(evp_transport.solvers) == 2
+    assert abs(assemble(evp_transport.h1 * dx) - mass) < 1e-8 * mass
+
+
+def test_evp_transport_model_explicit_substeps():
+    timestep = 600
+    dumpfreq = 10 ** 3
+    timescale = 1200
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(
+        family="CR", ocean_curr=ocean_curr, ic=ic, transport="explicit"
+    )
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    evp_transport = ElasticViscousPlasticTransport(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+
+    evp_transport.run()
+    tsolver = evp_transport.tsolver
+
+    assert len(tsolver.substeps) == 2
+    assert all(n >= 1 for n in tsolver.substeps)
+    assert timestep / tsolver.substeps[-1] * tsolver.speed() <= (
+        timestepping.cfl * tsolver.hmin
+    )
+
+
+def test_evp_transport_model_split_lag():
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 4
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(
+        family="CR", ocean_curr=ocean_curr, ic=ic, transport="split"
+    )
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    params = SeaIceParameters()
+
+    models = []
+    for state in [False, True]:
+        solver = SolverParameters(
+            preset="test", lag={"state": state, "steps": 3, "max_its": 5}
+        )
+        evp_transport = ElasticViscousPlasticTransport(
+            mesh=mesh,
+            conditions=conditions,
+            timestepping=timestepping,
+            output=output,
+            params=params,
+            solver_params=solver,
+        )
+        evp_transport.run()
+        models.append(evp_transport)
+
+    exact, lagged = models
+
+    # only the momentum solve is lagged, the linear transport solve never is
+    assert not isinstance(lagged.tsolver.solver, LaggedSolver)
+    for field in ["h1", "a1"]:
+        expected = getattr(exact, field)
+        assert errornorm(expected, getattr(lagged, field)) < 1e-6 * norm(expected)
@@ -0,0 +1,62 @@
+from seaice import *
+from firedrake import (
+    UnitSquareMesh,
+    FunctionSpace,
+    Function,
+    TestFunction,
+    Constant,
+    DirichletBC,
+    NonlinearVariationalProblem,
+    NonlinearVariationalSolver,
+    inner,
+    grad,
+    dx,
+    errornorm,
+)
+
+params = {
+    "snes_type": "newtonls",
+    "snes_rtol": 1e-10,
+    "snes_atol": 1e-12,
+    "snes_max_it": 8,
+    "ksp_type": "preonly",
+    "pc_type": "lu",
+}
+
+
+def problem(V, k, f):
+    u = Function(V)
+    v = TestFunction(V)
+    eqn = inner((1 + k * u ** 2) * grad(u), grad(v)) * dx - f * v * dx
+    bcs = DirichletBC(V, 0, "on_boundary")
+    return NonlinearVariationalProblem(eqn, u, bcs), u
+
+
+def test_lagged_solver_retry_after_divergence():
+    V = FunctionSpace(UnitSquareMesh(8, 8), "CG", 1)
+    k = Constant(0)
+    f = Constant(1)
+    nvp, u = problem(V, k, f)
+    lagged = LaggedSolver(
+        NonlinearVariationalSolver(nvp, solver_parameters=params), u, 10, 8
+    )
+    lagged.solve()
+
+    # the Jacobian of the linear problem is far from the one of the nonlinear
+    # problem, so the lagged solve runs out of iterations
+    k.assign(50)
+    f.assign(20)
+    guess = Function(u)
+
+    reference, v = problem(V, k, f)
+    v.assign(guess)
+    newton = NonlinearVariationalSolver(reference, solver_parameters=params)
+    newton.solve()
+
+    jacobians = lagged.jacobians
+    lagged.solve()
+
+    assert lagged.rebuilds == 2
+    # the retry starts from the guess, not from the diverged iterate
+    assert lagged.jacobians - jacobians == newton.snes.getIterationNumber()
+    assert errornorm(v, u) < 1e-8
@@ -0,0 +1,14 @@
+import sys
+import subprocess
+
+
+def test_import_does_not_load_optional_modules():
+    script = (
+        "import sys, seaice; "
+        "print([m for m in ('netCDF4', 'matplotlib') if m in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout.split("\n")[-2]
+
+    assert output == "[]"
@@ -0,0 +1,51 @@
+import pytest
+from seaice import *
+from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector
+
+
+@pytest.mark.parametrize(
+    "state, family", [(a, b) for a in [True, False] for b in ["CR", "CG"]]
+)
+def test_mevp_model_compile(state, family):
+    timestep = 600
+    dumpfreq = 10 ** 3
+    timescale = 1200
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 35
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5, "s": as_vector([[0, 0], [0, 0]])}
+    stabilised = {"state": state, "alpha": 1}
+    conditions = Conditions(
+        family=family, ocean_curr=ocean_curr, ic=ic, stabilised=stabilised
+    )
+
+    timestepping = TimesteppingParameters(
+        timescale=timescale, timestep=timestep, subcycles=10
+    )
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    mevp = ModifiedElasticViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+
+    t = mevp.run()
+
+    assert t == timescale
+    assert mevp.u1.dat.data_ro.max() > 0
@@ -0,0 +1,57 @@
+import pytest
+from seaice import *
+from firedrake import (
+    UnitSquareMesh,
+    VectorFunctionSpace,
+    Function,
+    SpatialCoordinate,
+    as_vector,
+    sin,
+    pi,
+)
+from netCDF4 import Dataset
+from pathlib import Path
+
+
+@pytest.mark.parametrize("norm_type", ["L2", "H1"])
+def test_diagnostics_evaluate(norm_type):
+    mesh = UnitSquareMesh(4, 4)
+    x, y = SpatialCoordinate(mesh)
+    v = Function(VectorFunctionSpace(mesh, "CG", 1))
+    solution = as_vector([sin(pi * x) * sin(pi * y), x * y])
+
+    energy = Energy(v)
+    error = Error(v, solution, norm_type)
+    # the cached forms follow the values of v
+    for scale in [0, 0.5, 1]:
+        v.interpolate(scale * solution)
+        assert energy.evaluate() == pytest.approx(Energy.compute(v), rel=1e-12)
+        assert error.evaluate() == pytest.approx(
+            Error.compute(v, solution, norm_type), rel=1e-12
+        )
+
+
+@pytest.mark.parametrize("buffer_size", [1, 3, 10])
+def test_output_diagnostics_buffer(buffer_size):
+    path = "./output/test-output"
+    Path(path).mkdir(parents=True, exist_ok=True)
+    dirname = path + "/diagnostics.nc"
+
+    mesh = UnitSquareMesh(4, 4)
+    v = Function(VectorFunctionSpace(mesh, "CG", 1))
+    v.interpolate(as_vector([1, 1]))
+
+    steps = 7
+
+    with OutputDiagnostics(
+        dirname=dirname, description="buffer test", buffer_size=buffer_size
+    ) as diag:
+        for t in range(steps):
+            diag.dump(v, t)
+        assert diag.count == steps % buffer_size
+        assert diag.dataset.dimensions["time"].size == steps - diag.count
+
+    with Dataset(dirname, "r") as dataset:
+        assert dataset.dimensions["time"].size == steps
+        assert list(dataset.variables["time"][:]) == list(range(steps))
+        assert dataset.variables["error"][:].mask.all()
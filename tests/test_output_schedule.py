@@ -0,0 +1,107 @@
+import pytest
+from seaice import *
+from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector
+
+
+def written(schedule, times, model=None):
+    return [t for t in times if schedule.due(model, t)]
+
+
+def test_schedule_dumpfreq():
+    schedule = OutputSchedule(dumpfreq=3)
+
+    assert written(schedule, range(1, 10)) == [3, 6, 9]
+
+
+def test_schedule_dumpinterval_uneven_steps():
+    schedule = OutputSchedule(dumpinterval=10)
+    times = [4, 9.5, 10, 13, 25, 26, 31]
+
+    # 25 is the first time past 20, and the output time 30 follows it
+    assert written(schedule, times) == [10, 25, 31]
+
+
+def test_schedule_dumplist():
+    schedule = OutputSchedule(dumplist=[5, 2, 12])
+
+    assert schedule.next_time() == 2
+    assert written(schedule, range(1, 15)) == [2, 5, 12]
+    assert schedule.next_time() == float("inf")
+
+
+def test_schedule_restart():
+    schedule = OutputSchedule(dumpinterval=10, dumplist=[5, 15], t=12)
+
+    assert schedule.next_time() == 15
+    assert written(schedule, [15, 20]) == [15, 20]
+
+
+def test_schedule_trigger():
+    schedule = OutputSchedule(triggers=[lambda model, t: t == 7])
+
+    assert written(schedule, range(1, 10)) == [7]
+
+
+class RecordingFile(object):
+    def __init__(self):
+        self.times = []
+
+    def write(self, *fields, time):
+        self.times.append(time)
+
+
+def vp_model(output, adaptive):
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5}
+    conditions = Conditions(family="CR", ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(
+        timescale=100, timestep=1, adaptive=adaptive
+    )
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    vp = ViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+    vp.assemble(vp.eqn, vp.u1, vp.bcs, solver.test_params)
+    vp.outfile = RecordingFile()
+    return vp
+
+
+def test_vp_model_dumpinterval_adaptive():
+    output = OutputParameters(
+        dirname="./output/test-output/u.pvd", dumpfreq=None, dumpinterval=25
+    )
+    adaptive = {"state": True, "method": "iterations", "target_its": 10}
+    vp = vp_model(output, adaptive)
+    vp.run()
+
+    assert vp.outfile.times == pytest.approx([25, 50, 75, 100])
+
+
+def test_vp_model_velocity_trigger():
+    trigger = VelocityThreshold(1e-12)
+    output = OutputParameters(
+        dirname="./output/test-output/u.pvd", dumpfreq=None, triggers=[trigger]
+    )
+    vp = vp_model(output, {"state": False})
+    vp.run()
+
+    # the ice starts at rest and is set moving in the first step
+    assert vp.outfile.times == [1]
+    assert trigger.above
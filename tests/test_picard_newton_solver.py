@@ -0,0 +1,69 @@
+import pytest
+from seaice import *
+from firedrake import (
+    UnitSquareMesh,
+    FunctionSpace,
+    Function,
+    TestFunction,
+    Constant,
+    DirichletBC,
+    NonlinearVariationalProblem,
+    NonlinearVariationalSolver,
+    derivative,
+    inner,
+    grad,
+    dx,
+)
+from firedrake.exceptions import ConvergenceError
+
+newton_params = {
+    "snes_type": "newtonls",
+    "snes_rtol": 1e-10,
+    "ksp_type": "preonly",
+    "pc_type": "lu",
+}
+
+
+def picard_newton(picard_params):
+    V = FunctionSpace(UnitSquareMesh(8, 8), "CG", 1)
+    u = Function(V)
+    u_lag = Function(V)
+    v = TestFunction(V)
+    f = Constant(20)
+    eqn = inner((1 + 10 * u ** 2) * grad(u), grad(v)) * dx - f * v * dx
+    picard_eqn = inner((1 + 10 * u_lag ** 2) * grad(u), grad(v)) * dx - f * v * dx
+    bcs = DirichletBC(V, 0, "on_boundary")
+
+    picard = NonlinearVariationalSolver(
+        NonlinearVariationalProblem(eqn, u, bcs, J=derivative(picard_eqn, u)),
+        solver_parameters=dict(newton_params, **picard_params),
+    )
+    newton = NonlinearVariationalSolver(
+        NonlinearVariationalProblem(eqn, u, bcs), solver_parameters=newton_params
+    )
+    return PicardNewtonSolver(picard, newton)
+
+
+def test_picard_newton_max_its():
+    solver = picard_newton({"snes_max_it": 1, "snes_linesearch_type": "basic"})
+    solver.solve()
+
+    assert solver.picard_its == [1]
+    assert solver.snes.getConvergedReason() > 0
+
+
+def test_picard_newton_failure():
+    # a linear solve that cannot converge is not a reason to switch to Newton
+    solver = picard_newton(
+        {
+            "snes_linesearch_type": "basic",
+            "ksp_type": "cg",
+            "ksp_max_it": 1,
+            "ksp_rtol": 1e-14,
+            "pc_type": "none",
+        }
+    )
+
+    with pytest.raises(ConvergenceError):
+        solver.solve()
+    assert solver.newton_its == []
@@ -0,0 +1,111 @@
+import json
+from seaice import *
+from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector
+
+
+def test_profiler_disabled():
+    profiler = Profiler(enabled=False)
+
+    assert profiler.phase("solve") is profiler.phase("update")
+    with profiler.phase("solve"):
+        pass
+    assert profiler.summary() == {}
+
+
+def test_profiler_nested():
+    profiler = Profiler(petsc=False)
+    for _ in range(3):
+        with profiler.phase("run"):
+            with profiler.phase("solve"):
+                pass
+
+    summary = profiler.summary()
+    assert summary["run"]["calls"] == 3
+    assert summary["run;solve"]["calls"] == 3
+    assert summary["run"]["self_seconds"] <= summary["run"]["seconds"]
+    assert profiler.folded().splitlines()[1].startswith("run;solve ")
+
+
+def test_vp_model_profile(tmp_path):
+    dirname = "./output/test-output/u.pvd"
+    profile = str(tmp_path / "profile.json")
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5}
+    conditions = Conditions(family="CR", ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=2, timestep=1)
+    output = OutputParameters(dirname=dirname, dumpfreq=1, profile=profile)
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    vp = ViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+    vp.assemble(vp.eqn, vp.u1, vp.bcs, solver.test_params)
+    vp.run()
+
+    with open(profile) as f:
+        summary = json.load(f)
+
+    assert summary["initial_condition"]["calls"] == 1
+    assert summary["run"]["calls"] == 1
+    assert summary["run;solve"]["calls"] == 2
+    assert summary["run;dump"]["calls"] == 2
+    assert "SNESSolve" in summary["run;solve;momentum"]["petsc"]
+
+
+def test_evp_transport_model_profile_roles():
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(
+        family="CR", ocean_curr=ocean_curr, ic=ic, transport="split"
+    )
+
+    timestepping = TimesteppingParameters(timescale=2, timestep=1)
+    output = OutputParameters(dirname=dirname, dumpfreq=10 ** 3)
+    # both solvers are wrapped, which must not merge their phases
+    solver = SolverParameters(
+        preset="test", lag={"state": True, "steps": 3, "max_its": 5}
+    )
+    params = SeaIceParameters()
+
+    evp_transport = ElasticViscousPlasticTransport(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+    evp_transport.profiler = Profiler(petsc=False)
+    evp_transport.run()
+
+    summary = evp_transport.profiler.summary()
+    assert summary["run;solve;momentum"]["calls"] == 2
+    assert summary["run;solve;transport"]["calls"] == 2
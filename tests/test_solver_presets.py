@@ -0,0 +1,89 @@
+import pytest
+from seaice import *
+from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector
+
+
+def test_solver_presets_by_name():
+    solver = SolverParameters()
+
+    assert solver.parameters() is solver.bt_params
+    assert solver.parameters("srt") is solver.srt_params
+    assert {
+        "gmres_ilu",
+        "fgmres_asm",
+        "gmres_amg",
+        "vp_mg",
+        "bjacobi",
+        "evpt_bjacobi",
+        "evp_schur",
+        "evpt_schur",
+    } <= set(
+        solver.presets()
+    )
+
+    with pytest.raises(ValueError):
+        solver.parameters("not_a_preset")
+
+
+def test_solver_presets_parallel_ilu():
+    # PETSc's ILU only runs on serial matrices, in parallel it has to be the
+    # subdomain solver of block Jacobi or ASM
+    solver = SolverParameters()
+
+    for name in solver.presets():
+        for key, value in solver.parameters(name).items():
+            if key.endswith("pc_type") and value == "ilu":
+                assert key.endswith("sub_pc_type"), (name, key)
+
+
+@pytest.mark.parametrize(
+    "model, preset",
+    [(ViscousPlastic, a) for a in ["gmres_ilu", "fgmres_asm", "gmres_amg", "vp_mg"]]
+    + [
+        (ElasticViscousPlastic, a)
+        for a in ["gmres_ilu", "fgmres_asm", "bjacobi", "fs", "evp_schur", "evp_sc"]
+    ],
+)
+def test_solver_presets(model, preset):
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 1
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 35
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(family="CG", ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    ice = model(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+
+    if model is ViscousPlastic:
+        ice.assemble(ice.eqn, ice.u1, ice.bcs, preset)
+    else:
+        ice.assemble(ice.eqn, ice.w1, ice.bcs, preset)
+
+    t = ice.run()
+
+    assert t > 0
+    assert ice.usolver.snes.getConvergedReason() > 0
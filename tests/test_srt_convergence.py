@@ -187,6 +187,78 @@ def test_srt_cg_convergence(order, theta):
     assert round(error_slope - order - 2, 1) == 0
 
 
+@pytest.mark.parametrize("theta", [0, 0.5, 1])
+def test_srt_hierarchy_convergence(theta):
+    timestep = 1
+    dumpfreq = 10 ** 6
+    timescale = 2
+    length = 5 * 10 ** 5
+    pi_x = pi / length
+
+    zero = Constant(0)
+    zero_vector = Constant(as_vector([0, 0]))
+
+    dirname = "./output/test-output/test.pvd"
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    params = SeaIceParameters(
+        rho=1, rho_a=zero, C_a=zero, rho_w=zero, C_w=zero, cor=zero
+    )
+
+    def setup(mesh, callbacks, initial_guess):
+        x, y = SpatialCoordinate(mesh)
+        v_exp = as_vector(
+            [-sin(pi_x * x) * sin(pi_x * y), -sin(pi_x * x) * sin(pi_x * y)]
+        )
+
+        ic = {"u": v_exp, "a": 1, "h": 1}
+        conditions = Conditions(ic=ic, theta=theta)
+        srt = ViscousPlastic(
+            mesh=mesh,
+            conditions=conditions,
+            timestepping=timestepping,
+            output=output,
+            params=params,
+            solver_params=solver,
+        )
+
+        zeta = srt.zeta(srt.h, srt.a, params.Delta_min)
+        sigma = zeta * srt.strain(grad(srt.u1))
+        sigma_exp = zeta * srt.strain(grad(v_exp))
+
+        eqn = srt.momentum_equation(
+            srt.h,
+            srt.u1,
+            srt.u0,
+            srt.p,
+            sigma,
+            params.rho,
+            zero_vector,
+            conditions.ocean_curr,
+            params.rho_a,
+            params.C_a,
+            params.rho_w,
+            params.C_w,
+            conditions.geo_wind,
+            params.cor,
+            timestep,
+        )
+        eqn += timestep * inner(div(sigma_exp), srt.p) * dx
+
+        srt.assemble(eqn, srt.u1, srt.bcs, solver.test_params)
+        srt.run(callbacks=callbacks, initial_guess=initial_guess)
+
+        return Error.compute(srt.u1, v_exp)
+
+    study = HierarchyConvergenceStudy(setup, 5, 4, length)
+    study.run()
+
+    assert study.number_of_triangles == [5, 10, 20, 40, 80]
+    assert round(study.slope() - 2, 1) == 0
+
+
 if __name__ == "__main__":
     import sys
 
@@ -0,0 +1,61 @@
+import numpy as np
+from seaice import *
+from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector
+
+
+def evp_model(telemetry):
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(family="CG", ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=3, timestep=1)
+    output = OutputParameters(dirname=dirname, dumpfreq=10 ** 3)
+    solver = SolverParameters(telemetry=telemetry)
+    params = SeaIceParameters()
+
+    evp = ElasticViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+    evp.assemble(evp.eqn, evp.w1, evp.bcs, solver.srt_params)
+    return evp
+
+
+def test_telemetry_records_every_solve(tmp_path):
+    evp = evp_model({"state": True, "verbose": False})
+    diag = OutputDiagnostics(str(tmp_path / "evp.nc"), "telemetry")
+
+    evp.run(diagnostics=diag)
+    usolver = evp.usolver
+    telemetry = usolver.telemetry()
+
+    assert telemetry["solves"] == 3
+    assert telemetry["failed"] == 0
+    assert len(usolver.residuals) == 3
+    for residuals, its in zip(usolver.residuals, usolver.newton_its):
+        assert len(residuals) == its + 1
+        assert residuals[-1] < residuals[0]
+    assert np.all(diag.dataset.variables["newton_its"][:] == usolver.newton_its)
+
+
+def test_telemetry_off():
+    evp = evp_model({"state": False, "verbose": False})
+    evp.run()
+
+    assert not isinstance(evp.usolver, MonitoredSolver)
+    assert evp.telemetry() is None
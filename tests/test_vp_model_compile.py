@@ -1,6 +1,14 @@
 import pytest
 from seaice import *
-from firedrake import PeriodicSquareMesh, SpatialCoordinate, as_vector
+from firedrake import (
+    PeriodicSquareMesh,
+    SquareMesh,
+    MeshHierarchy,
+    SpatialCoordinate,
+    as_vector,
+    errornorm,
+    norm,
+)
 
 
 @pytest.mark.parametrize(
@@ -109,3 +117,97 @@ def test_vp_model_compile(state, theta, order):
         t += timestep
 
     assert t > 0
+
+
+@pytest.mark.parametrize("family", ["CR", "CG"])
+def test_vp_model_multigrid(family):
+    timestep = 1
+    dumpfreq = 10 ** 3
+    timescale = 1
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 10
+    length = 5 * 10 ** 5
+    hierarchy = MeshHierarchy(
+        SquareMesh(number_of_triangles, number_of_triangles, length), 2
+    )
+    mesh = hierarchy[-1]
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5}
+    conditions = Conditions(family=family, ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    params = SeaIceParameters()
+
+    vp = ViscousPlastic(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+
+    vp.assemble(vp.eqn, vp.u1, vp.bcs, "vp_mg")
+
+    t = vp.run()
+
+    assert t > 0
+    assert vp.usolver.snes.getKSP().getPC().getType() == "mg"
+    assert vp.usolver.snes.getConvergedReason() > 0
+
+
+@pytest.mark.parametrize("family", ["CR", "CG"])
+def test_vp_model_picard(family):
+    timestep = 10
+    dumpfreq = 10 ** 3
+    timescale = 30
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 20
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 0.5}
+    conditions = Conditions(family=family, ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    params = SeaIceParameters()
+
+    solutions = []
+    for picard in [False, True]:
+        solver = SolverParameters()
+        solver.picard = {"state": picard, "max_its": 5, "rtol": 1e-2}
+
+        vp = ViscousPlastic(
+            mesh=mesh,
+            conditions=conditions,
+            timestepping=timestepping,
+            output=output,
+            params=params,
+            solver_params=solver,
+        )
+        vp.assemble(vp.eqn, vp.u1, vp.bcs, solver.srt_params, picard=vp.picard)
+        vp.run()
+        solutions.append(vp.u1)
+
+    stats = vp.usolver.statistics()
+    assert stats["picard_its"] > 0
+    assert errornorm(solutions[0], solutions[1]) < 1e-6 * norm(solutions[0])
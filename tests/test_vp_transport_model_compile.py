@@ -57,3 +57,48 @@ def test_vp_transport_model_compile(family, theta):
         t += timestep
 
     assert t > 0
+
+
+@pytest.mark.parametrize("family", ["CR", "CG"])
+def test_vp_transport_model_picard(family):
+    timestep = 10
+    dumpfreq = 10 ** 3
+    timescale = 30
+
+    dirname = "./output/test-output/u.pvd"
+
+    number_of_triangles = 20
+    length = 5 * 10 ** 5
+    mesh = PeriodicSquareMesh(number_of_triangles, number_of_triangles, length)
+
+    x, y = SpatialCoordinate(mesh)
+
+    ocean_curr = as_vector(
+        [0.1 * (2 * y - length) / length, -0.1 * (length - 2 * x) / length]
+    )
+
+    ic = {"u": 0, "a": x / length, "h": 1, "s": as_vector([[0, 0], [0, 0]])}
+    conditions = Conditions(family=family, ocean_curr=ocean_curr, ic=ic)
+
+    timestepping = TimesteppingParameters(timescale=timescale, timestep=timestep)
+    output = OutputParameters(dirname=dirname, dumpfreq=dumpfreq)
+    solver = SolverParameters()
+    solver.preset = "srt"
+    solver.picard = {"state": True, "max_its": 5, "rtol": 1e-2}
+    params = SeaIceParameters()
+
+    vp_transport = ViscousPlasticTransport(
+        mesh=mesh,
+        conditions=conditions,
+        timestepping=timestepping,
+        output=output,
+        params=params,
+        solver_params=solver,
+    )
+
+    t = vp_transport.run()
+
+    stats = vp_transport.usolver.statistics()
+    assert t > 0
+    assert stats["picard_its"] > 0
+    assert stats["newton_its"] >= 0
@@ -0,0 +1,44 @@
+import pytest
+from seaice import *
+from seaice.warmup import warmup, main, box_conditions
+from firedrake import Constant, as_vector
+
+
+@pytest.mark.parametrize("name, variants", [("vp", 1), ("evpt", 3)])
+def test_warmup(name, variants):
+    timings = warmup([name], families=["CR"], periodic=False, verbose=False)
+
+    # each variant is compiled with and without stabilisation
+    assert len(timings) == 2 * variants
+    assert all(seconds > 0 for combination, seconds in timings)
+
+
+def test_warmup_main():
+    main(["--models", "evp", "--families", "CG", "--no-periodic"])
+
+
+def test_warmup_job_forms():
+    built = []
+
+    # the forcing and solver parameters of a job, rather than the box test
+    def conditions(mesh, family, theta, stabilised, **options):
+        built.append("conditions")
+        job = box_conditions(mesh, family, theta, stabilised, **options)
+        job.geo_wind = as_vector([Constant(5), Constant(5)])
+        return job
+
+    def solver_params(**options):
+        built.append("solver_params")
+        return SolverParameters(preset="srt", **options)
+
+    timings = warmup(
+        ["vp"],
+        families=["CR"],
+        periodic=False,
+        verbose=False,
+        conditions=conditions,
+        solver_params=solver_params,
+    )
+
+    assert built.count("conditions") == len(timings)
+    assert built.count("solver_params") == len(timings)